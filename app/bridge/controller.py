@@ -1,5 +1,6 @@
 """Module for the Bridge entity controller."""
 
+import logging
 from pathlib import Path  # Add Path import for SCIA template
 from typing import Any, TypedDict, cast  # Import cast, Any, and TypedDict
 
@@ -24,7 +25,7 @@ from viktor.views import (
 )
 
 # ParamsForLoadZones protocol and validate_load_zone_widths are in app.bridge.utils
-from app.bridge.utils import validate_load_zone_widths
+from app.bridge.utils import figure_to_json, section_view_json_cached, validate_load_zone_widths
 from app.common.map_utils import (
     load_and_filter_bridge_shapefile,  # Import the new function
     process_bridge_geometries,
@@ -53,7 +54,7 @@ from src.geometry.model_creator import (
     BridgeSegmentDimensions,  # Import the dataclass
     LoadZoneGeometryData,  # Import the dataclass
     create_2d_top_view,
-    create_3d_model,
+    export_3d_model_glb_cached,
     prepare_load_zone_geometry_data,
 )
 from src.geometry.top_view_plot import build_top_view_figure
@@ -67,6 +68,19 @@ from .parametrization import (
     BridgeParametrization,
 )
 
+# Diagnostics go through logging (not print), so view requests don't write to stdout unless configured to
+logger = logging.getLogger(__name__)
+
+
+def _serialize_placeholder_figure(title_text: str) -> str:
+    """Builds an empty Plotly figure with hidden axes and only a title, serialized to JSON."""
+    return figure_to_json(go.Figure().update_layout(title_text=title_text, xaxis_visible=False, yaxis_visible=False))
+
+
+# Static fallback figures are serialized once at import time instead of on every view request
+_NO_LOAD_ZONES_FIGURE_JSON = _serialize_placeholder_figure("Belastingzones - Geen zones gedefinieerd")
+_INVALID_SEGMENTS_FIGURE_JSON = _serialize_placeholder_figure("Belastingzones - Brugsegmenten ongeldig")
+
 
 # Define TypedDict for a row from params.bridge_segments_array
 class BridgeSegmentParamRow(TypedDict):
@@ -119,7 +133,7 @@ class BridgeController(ViktorController):
         except UserError:
             raise
         except Exception as e:
-            print(f"Error preparing bridge geometry for load zones view: {e}")  # noqa: T201
+            logger.exception("Error preparing bridge geometry for load zones view")
             raise UserError("Fout bij voorbereiden bruggeometrie. Controleer de Dimensies tab.") from e
 
     def _get_bridge_entity_data(self, entity_id: int) -> tuple[str | None, str | None, MapResult | None]:
@@ -186,11 +200,8 @@ class BridgeController(ViktorController):
     @GeometryView("3D Model", duration_guess=1, x_axis_to_right=False)
     def get_3d_view(self, params: BridgeParametrization, **kwargs) -> GeometryResult:  # noqa: ARG002
         """Generates a 3D representation of the bridge deck."""
-        combined_scene = create_3d_model(params, section_planes=True)
-        # Export the scene as a GLTF file and return it as a GeometryResult
-        geometry = File()
-        with geometry.open_binary() as w:
-            w.write(trimesh.exchange.gltf.export_glb(combined_scene))
+        # Export the scene as a GLTF file (cached per parameter set) and return it as a GeometryResult
+        geometry = File.from_data(export_3d_model_glb_cached(params, section_planes=True))
         return GeometryResult(geometry, geometry_type="gltf")
 
     @PlotlyView("Bovenaanzicht", duration_guess=1)
@@ -210,7 +221,7 @@ class BridgeController(ViktorController):
                     if not all(hasattr(segment_param_row, attr) for attr in ["bz1", "bz2", "bz3", "l"]):
                         # Silently skip or log if a segment is malformed to avoid blocking top view
                         # Or raise UserError("Een of meer brugsegmenten missen data (bz1, bz2, bz3, l).")
-                        print(f"Warning: Malformed bridge segment data in get_top_view: {segment_param_row}")  # noqa: T201
+                        logger.warning("Malformed bridge segment data in get_top_view: %s", segment_param_row)
                         continue  # Skip this segment if it's missing critical attributes
                     typed_bridge_dimensions.append(
                         BridgeSegmentDimensions(
@@ -220,7 +231,7 @@ class BridgeController(ViktorController):
                 if typed_bridge_dimensions:  # Only proceed if we have valid dimensions to process
                     bridge_geom_data = prepare_load_zone_geometry_data(typed_bridge_dimensions)
             except Exception as e:
-                print(f"Error preparing bridge geometry for validation in get_top_view: {e}")  # noqa: T201
+                logger.warning("Error preparing bridge geometry for validation in get_top_view: %s", e)
                 # bridge_geom_data remains None
 
         # 2. Perform validation if possible
@@ -240,7 +251,7 @@ class BridgeController(ViktorController):
         # 4. Build the figure
         fig = build_top_view_figure(top_view_geometric_data=top_view_data, validation_messages=validation_messages)
 
-        return PlotlyResult(fig.to_json())
+        return PlotlyResult(figure_to_json(fig))
 
     @PlotlyView("Horizontale doorsnede", duration_guess=1)
     def get_2d_horizontal_section(self, params: BridgeParametrization, **kwargs) -> PlotlyResult:  # noqa: ARG002
@@ -259,8 +270,7 @@ class BridgeController(ViktorController):
             PlotlyResult: A 2D representation of the horizontal section.
 
         """
-        fig = create_horizontal_section_view(params, params.input.dimensions.horizontal_section_loc)
-        return PlotlyResult(fig.to_json())
+        return PlotlyResult(section_view_json_cached(create_horizontal_section_view, params, params.input.dimensions.horizontal_section_loc))
 
     @PlotlyView("Langsdoorsnede", duration_guess=1)
     def get_2d_longitudinal_section(self, params: BridgeParametrization, **kwargs) -> PlotlyResult:  # noqa: ARG002
@@ -279,8 +289,7 @@ class BridgeController(ViktorController):
             PlotlyResult: A 2D representation of the longitudinal section.
 
         """
-        fig = create_longitudinal_section(params, params.input.dimensions.longitudinal_section_loc)
-        return PlotlyResult(fig.to_json())
+        return PlotlyResult(section_view_json_cached(create_longitudinal_section, params, params.input.dimensions.longitudinal_section_loc))
 
     @PlotlyView("Dwarsdoorsnede", duration_guess=1)
     def get_2d_cross_section(self, params: BridgeParametrization, **kwargs) -> PlotlyResult:  # noqa: ARG002
@@ -299,8 +308,7 @@ class BridgeController(ViktorController):
             PlotlyResult: A 2D representation of the cross-section.
 
         """
-        fig = create_cross_section_view(params, params.input.dimensions.cross_section_loc)
-        return PlotlyResult(fig.to_json())
+        return PlotlyResult(section_view_json_cached(create_cross_section_view, params, params.input.dimensions.cross_section_loc))
 
     @PlotlyView("Belastingzones", duration_guess=1)
     def get_load_zones_view(self, params: BridgeParametrization, **kwargs) -> PlotlyResult:  # noqa: ARG002
@@ -324,16 +332,12 @@ class BridgeController(ViktorController):
                 load_zones_data_params.append(row_data)
 
         if not load_zones_data_params:  # No load zones defined
-            fig = go.Figure()
-            fig.update_layout(title_text="Belastingzones - Geen zones gedefinieerd", xaxis_visible=False, yaxis_visible=False)
-            return PlotlyResult(fig.to_json())
+            return PlotlyResult(_NO_LOAD_ZONES_FIGURE_JSON)
 
         # 2. Prepare bridge geometric data
         bridge_geom_data = self._prepare_bridge_geometry_for_plotting(params.bridge_segments_array)
         if not bridge_geom_data:  # If preparation failed or returned None (e.g. no segments)
-            fig = go.Figure()
-            fig.update_layout(title_text="Belastingzones - Brugsegmenten ongeldig", xaxis_visible=False, yaxis_visible=False)
-            return PlotlyResult(fig.to_json())
+            return PlotlyResult(_INVALID_SEGMENTS_FIGURE_JSON)
 
         # 3. Get validation messages
         validation_messages: list[str] = []
@@ -349,7 +353,7 @@ class BridgeController(ViktorController):
         # (This is the same data used for the "Bovenaanzicht" base plot)
         top_view_render_data = create_2d_top_view(params)
 
-        base_traces = []
+        base_traces: list[go.Scatter | go.Scattergl] = []
         # No longer adding structural polygons to this view's base traces
 
         bridge_outline_data = top_view_render_data.get("bridge_lines", [])  # Bridge outline from top view
@@ -381,7 +385,7 @@ class BridgeController(ViktorController):
             presentation_details=presentation_details_arg,
         )
 
-        return PlotlyResult(fig.to_json())
+        return PlotlyResult(figure_to_json(fig))
 
     @TableView("Belastingscombinaties")
     def get_load_combinations_view(self) -> TableResult:
@@ -496,19 +500,10 @@ class BridgeController(ViktorController):
             )
 
             # Export the scene as a GLTF file and return it as a GeometryResult
-            geometry = File()
-            with geometry.open_binary() as w:
-                w.write(trimesh.exchange.gltf.export_glb(scene))
+            geometry = File.from_data(trimesh.exchange.gltf.export_glb(scene))
             return GeometryResult(geometry, geometry_type="gltf")
 
         except Exception as e:
-            # Create error visualization
-            error_box = trimesh.creation.box(extents=[1, 1, 0.1])
-            error_box.visual.face_colors = [255, 100, 100, 255]  # Red color for error
-
-            scene = trimesh.Scene()
-            scene.add_geometry(error_box, node_name="Error")
-
             raise UserError(f"Fout bij genereren SCIA model preview: {e!s}")
 
     def download_scia_xml_files(self, params: BridgeParametrization, **kwargs) -> DownloadResult:  # noqa: ARG002
@@ -1,20 +1,29 @@
 """Functions for geometry calculations in the Bridge application."""
 
 import csv
+from functools import lru_cache
 
 from app.constants import REINFORCEMENT_PATH
 
 
+@lru_cache(maxsize=1)
+def _read_steel_qualities() -> tuple[str, ...]:
+    """Reads the steel quality names from the CSV file once; the file is static, so the result is cached."""
+    with open(REINFORCEMENT_PATH) as f:
+        # Only one column is needed, so rows are read as lists and indexed by position instead of as dicts
+        csv_reader = csv.reader(f, delimiter=";")
+        column = next(csv_reader).index("Betonstaalkwaliteit")
+        return tuple(row[column].strip('"') for row in csv_reader if row)  # DictReader also skipped blank lines
+
+
 def get_steel_qualities() -> list[str]:
     """
     Get list of available steel qualities from the CSV file.
 
+    The CSV file is only read on the first call; later calls return a new list from the cached names.
+
     Returns:
         list: List of steel quality names
 
     """
-    csv_path = REINFORCEMENT_PATH
-
-    with open(csv_path) as f:
-        csv_reader = csv.DictReader(f, delimiter=";")
-        return [row["Betonstaalkwaliteit"].strip('"') for row in csv_reader]
+    return list(_read_steel_qualities())
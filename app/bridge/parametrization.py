@@ -2,6 +2,7 @@
 
 import json
 from collections.abc import Callable, Mapping
+from functools import lru_cache
 from typing import Any
 
 from viktor import DynamicArray
@@ -108,37 +109,35 @@ def _create_default_dimension_segment_row(l_value: int, is_first: bool) -> dict[
     }
 
 
+# Names of the dX_width fields of a load zone row
+_DX_WIDTH_KEYS = tuple(f"d{i}_width" for i in range(1, MAX_LOAD_ZONE_SEGMENT_FIELDS + 1))
+
+
 def _create_default_load_zone_row(zone_type: str, default_width: float) -> dict[str, Any]:
     """Creates a dictionary for a default load zone row."""
-    row: dict[str, Any] = {"zone_type": zone_type}
-    for i in range(1, MAX_LOAD_ZONE_SEGMENT_FIELDS + 1):
-        row[f"d{i}_width"] = default_width
-    return row
+    return {"zone_type": zone_type, **dict.fromkeys(_DX_WIDTH_KEYS, default_width)}
 
 
 # --- Helper functions for Parametrization Logic (e.g., visibility callbacks) ---
 def _get_current_num_load_zones(params_obj: Mapping) -> int:
     """Helper to get the current number of load zones from params.load_zones_data_array."""
-    try:
-        load_zones_array = params_obj.load_zones_data_array
-        if load_zones_array is None or not isinstance(load_zones_array, list | tuple):
-            return 0
-        return len(load_zones_array)
-    except AttributeError:
-        # Parameters not yet fully defined during app initialization or update – treat as "0" zones
-        return 0
+    # Parameters not yet fully defined during app initialization or update (missing or None) – treat as "0" zones
+    load_zones_array = getattr(params_obj, "load_zones_data_array", None)
+    return len(load_zones_array) if load_zones_array else 0
 
 
 def _get_current_num_segments(params_obj: Mapping) -> int:
     """Helper to get the current number of segments from params.bridge_segments_array."""
-    try:
-        dimension_array = params_obj.bridge_segments_array
-        if dimension_array is None or not isinstance(dimension_array, list | tuple):
-            return 0
-        return len(dimension_array)
-    except AttributeError:
-        # Parameters not yet fully defined during app initialization or update – treat as "0" segments
-        return 0
+    # Parameters not yet fully defined during app initialization or update (missing or None) – treat as "0" segments
+    dimension_array = getattr(params_obj, "bridge_segments_array", None)
+    return len(dimension_array) if dimension_array else 0
+
+
+@lru_cache(maxsize=64)
+def _dx_width_visibility(num_load_zones: int, segment_exists: bool) -> tuple[bool, ...]:
+    """Visibility per load zone row (at least one) of a dX_width field, cached per load zone count (shared by all dX_width fields)."""
+    # All rows but the last show the width if the segment exists; the last load zone row never shows a width
+    return (segment_exists,) * (num_load_zones - 1) + (False,)
 
 
 # Factory function to create visibility callbacks for dX_width fields
@@ -164,18 +163,11 @@ def _create_dx_width_visibility_callback(required_segment_count: int) -> Callabl
         1. The number of defined bridge segments is >= required_segment_count.
         2. The row is not the last row in the load_zones_array.
         """
-        num_segments = _get_current_num_segments(params)
         num_load_zones = _get_current_num_load_zones(params)
-
         if num_load_zones <= 0:
             return []
-
-        visibility_list = []
-        for i in range(num_load_zones):
-            is_visible = (num_segments >= required_segment_count) and (i < num_load_zones - 1)
-            visibility_list.append(is_visible)
-
-        return visibility_list
+        segment_exists = _get_current_num_segments(params) >= required_segment_count
+        return list(_dx_width_visibility(num_load_zones, segment_exists))
 
     return dx_width_visibility_function
 
@@ -198,15 +190,15 @@ def define_options_numbering(params: Mapping, **kwargs) -> list:  # noqa: ARG001
         list: List of zone numbers in format "location-segment" (e.g., ["1-1", "2-1", "3-1", "1-2", "2-2", "3-2"])
 
     """
-    option_list = []
     num_segments = len(params.bridge_segments_array) - 1
-    # For each segment
-    for segment in range(num_segments):
-        # For each zone (left, middle, right)
-        for zone in range(3):
-            zone_number = f"{zone + 1}-{segment + 1}"
-            option_list.append(zone_number)
-    return option_list
+    # A new list per call, so callers can't change the cached labels
+    return list(_zone_number_labels(num_segments))
+
+
+@lru_cache(maxsize=32)
+def _zone_number_labels(num_segments: int) -> tuple[str, ...]:
+    """Zone number labels per segment (left, middle, right zone), cached per number of segments."""
+    return tuple(f"{zone + 1}-{segment + 1}" for segment in range(num_segments) for zone in range(3))
 
 
 # --- Helper function to get min and max values of the model ---
@@ -1,11 +1,19 @@
 """Utility functions specific to the Bridge entity's UI or Plotly views."""
 
+import json
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 from typing import Protocol as TypingProtocol
 
+import orjson
+import plotly.graph_objects as go
+from munch import Munch  # type: ignore[import-untyped]
+
 # Import for validate_load_zone_widths - ensure this path is correct
 from src.geometry.model_creator import (
     LoadZoneGeometryData,  # BridgeSegmentDimensions is not directly used here anymore
+    section_view_cache_key,
 )
 
 # All plotting helper functions below have been moved to src/geometry/load_zone_plot.py or src/common/plot_utils.py
@@ -19,6 +27,49 @@ from src.geometry.model_creator import (
 # add_load_zone_visuals
 
 
+# --- Serialization ---
+def figure_to_json(fig: go.Figure) -> str:
+    """
+    Serializes a Plotly figure to a JSON string for a PlotlyResult.
+
+    The figure is exported as a plain dict and encoded with orjson (C encoder with native numpy support) instead of
+    going through Plotly's own JSON encoder.
+
+    Args:
+        fig: The Plotly figure to serialize.
+
+    Returns:
+        str: The figure as a JSON string.
+
+    """
+    return orjson.dumps(fig.to_plotly_json(), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+@lru_cache(maxsize=32)
+def _section_view_json_from_key(create_view: Callable[[Munch, float], go.Figure], params_key: str, section_loc: float) -> str:
+    """Creates and serializes a section view for serialized section parameters (see section_view_json_cached)."""
+    return figure_to_json(create_view(Munch.fromDict(json.loads(params_key)), section_loc))
+
+
+def section_view_json_cached(create_view: Callable[[Munch, float], go.Figure], params: dict | Munch, section_loc: float) -> str:
+    """
+    Memoized JSON of a 2D section view, for a PlotlyResult.
+
+    The serialized figure is cached per view function, section parameters and section location, so switching
+    between the section views without changing the input returns the stored JSON without rebuilding the figure.
+
+    Args:
+        create_view: The section view function, e.g. create_cross_section_view.
+        params: Input parameters for the bridge dimensions.
+        section_loc: Location of the section, passed on to the view function.
+
+    Returns:
+        str: The figure as a JSON string.
+
+    """
+    return _section_view_json_from_key(create_view, section_view_cache_key(params), section_loc)
+
+
 # --- Validation --- (This section remains)
 class ParamsForLoadZones(TypingProtocol):
     """Protocol defining the expected structure of params for load zone data itself."""
@@ -1,52 +1,12 @@
 """Common utility functions for Plotly plots within the src layer."""
 
-from typing import Any
+from typing import Any, Literal, overload
 
+import numpy as np
 import plotly.graph_objects as go
 
-
-def create_text_annotations_from_data(  # noqa: PLR0913
-    label_data: list[dict[str, Any]],
-    font_size: int = 12,
-    font_color: str = "black",
-    xanchor: str = "center",
-    yanchor: str = "bottom",
-    showarrow: bool = False,
-    text_prefix: str = "<b>",
-    text_suffix: str = "</b>",
-    **kwargs,  # To pass any other go.layout.Annotation properties
-) -> list[go.layout.Annotation]:
-    """
-    Creates a list of Plotly text annotations from a list of data dictionaries.
-
-    Args:
-        label_data: List of dictionaries, each with 'text', 'x', 'y' keys.
-        font_size: Font size for the annotation text.
-        font_color: Color of the annotation text.
-        xanchor: Horizontal anchor for the text.
-        yanchor: Vertical anchor for the text.
-        showarrow: Whether to show an arrow pointing to the annotation.
-        text_prefix: Prefix for the text (e.g., for bold tags).
-        text_suffix: Suffix for the text (e.g., for bold tags).
-        **kwargs: Additional properties to pass to go.layout.Annotation.
-
-    Returns:
-        A list of go.layout.Annotation objects.
-
-    """
-    return [
-        go.layout.Annotation(
-            x=data_item["x"],
-            y=data_item["y"],
-            text=f"{text_prefix}{data_item['text']}{text_suffix}",
-            font={"size": font_size, "color": font_color},
-            xanchor=xanchor,
-            yanchor=yanchor,
-            showarrow=showarrow,
-            **kwargs,
-        )
-        for data_item in label_data
-    ]
+# Line traces with more points than this are drawn with WebGL (scattergl) instead of SVG (scatter)
+WEBGL_POINT_THRESHOLD = 1000
 
 
 def create_structural_polygons_traces(zone_polygons_data: list[dict[str, Any]]) -> list[go.Scatter]:
@@ -86,20 +46,55 @@ def create_structural_polygons_traces(zone_polygons_data: list[dict[str, Any]])
     return traces
 
 
-def create_bridge_outline_traces(bridge_lines_data: list[dict[str, Any]]) -> list[go.Scatter]:
+@overload
+def create_bridge_outline_traces(
+    bridge_lines_data: list[dict[str, Any]],
+    color: str = ...,
+    width: float = ...,
+    name: str | None = ...,
+    as_dict: Literal[False] = ...,
+) -> list[go.Scatter | go.Scattergl]: ...
+
+
+@overload
+def create_bridge_outline_traces(
+    bridge_lines_data: list[dict[str, Any]],
+    color: str = ...,
+    width: float = ...,
+    name: str | None = ...,
+    *,
+    as_dict: Literal[True],
+) -> list[dict[str, Any]]: ...
+
+
+def create_bridge_outline_traces(
+    bridge_lines_data: list[dict[str, Any]],
+    color: str = "grey",
+    width: float = 1,
+    name: str | None = None,
+    as_dict: bool = False,
+) -> list[go.Scatter | go.Scattergl] | list[dict[str, Any]]:
     """
-    Creates Scatter traces for the bridge outline segments.
+    Creates line traces for the bridge outline segments.
+
+    Segments with the same line style are drawn as one trace, with a NaN break between the segments, so the
+    outline takes a single trace per style instead of one per segment. As for the section lines, the coordinates
+    are sent as float32 and an outline with more than WEBGL_POINT_THRESHOLD points is drawn with WebGL.
 
     Args:
         bridge_lines_data: A list of dictionaries, each representing a line segment
                            and contains 'start' ([x,y] point) and 'end' ([x,y] point),
                            and optionally 'color' and 'width'.
+        color: Line color of the segments that do not specify their own.
+        width: Line width of the segments that do not specify their own.
+        name: Optional trace name.
+        as_dict: Return plain trace dicts (for figures built with validation disabled) instead of graph objects.
 
     Returns:
-        A list of go.Scatter traces for the bridge outline.
+        A list of traces for the bridge outline, one per line style.
 
     """
-    traces = []
+    segments_by_style: dict[tuple[Any, Any], list[tuple[Any, Any]]] = {}
     for line_segment in bridge_lines_data:
         start_point = line_segment.get("start")
         end_point = line_segment.get("end")
@@ -107,18 +102,54 @@ def create_bridge_outline_traces(bridge_lines_data: list[dict[str, Any]]) -> lis
         if not start_point or not end_point:
             continue
 
-        # Use defaults consistent with original app/bridge/utils.py if not provided
-        color = line_segment.get("color", "grey")
-        width = line_segment.get("width", 1)
+        style = (line_segment.get("color", color), line_segment.get("width", width))
+        segments_by_style.setdefault(style, []).append((start_point[:2], end_point[:2]))
 
-        traces.append(
-            go.Scatter(
-                x=[start_point[0], end_point[0]],
-                y=[start_point[1], end_point[1]],
-                mode="lines",
-                line={"color": color, "width": width},
-                hoverinfo="none",
-                showlegend=False,
-            )
-        )
-    return traces
+    traces = []
+    for (line_color, line_width), segments in segments_by_style.items():
+        # (N, 2, 2) array of segment start/end points; a NaN break is inserted after each end point
+        # before flattening the segments into the trace coordinates
+        segment_array = np.asarray(segments, dtype=np.float32)
+        coords = np.insert(segment_array, 2, np.nan, axis=1).reshape(-1, 2)[:-1]  # Drop the trailing break
+        trace: dict[str, Any] = {
+            "type": "scattergl" if len(coords) > WEBGL_POINT_THRESHOLD else "scatter",
+            "x": coords[:, 0],
+            "y": coords[:, 1],
+            "mode": "lines",
+            "line": {"color": line_color, "width": line_width},
+            "hoverinfo": "none",
+            "showlegend": False,
+        }
+        if name is not None:
+            trace["name"] = name
+        traces.append(trace)
+
+    if as_dict:
+        return traces
+    return [go.Scattergl(trace) if trace.pop("type") == "scattergl" else go.Scatter(trace) for trace in traces]
+
+
+def create_section_line_trace(x: np.ndarray, y: np.ndarray) -> dict[str, Any]:
+    """
+    Creates the (plain dict) line trace for a section view.
+
+    All section lines are drawn as one trace, broken at NaN values. Dense sections are switched to WebGL, which
+    stays responsive in the browser where SVG paths with many points do not. The coordinates are sent as float32,
+    which halves the serialized arrays and is still far below screen resolution at bridge scale.
+
+    Args:
+        x: The x-coordinates of the section lines, with NaN between separate lines.
+        y: The y-coordinates of the section lines, with NaN between separate lines.
+
+    Returns:
+        A scatter (or scattergl) trace dict.
+
+    """
+    trace_type = "scattergl" if len(x) > WEBGL_POINT_THRESHOLD else "scatter"
+    return {
+        "type": trace_type,
+        "x": np.asarray(x, dtype=np.float32),
+        "y": np.asarray(y, dtype=np.float32),
+        "mode": "lines",
+        "line": {"color": "black"},
+    }
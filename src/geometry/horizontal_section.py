@@ -1,27 +1,39 @@
 """Module for creating horizontal section views of the bridge."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import plotly.graph_objects as go
-import trimesh
 from munch import Munch  # type: ignore[import-untyped]
 
-from src.geometry.model_creator import create_3d_model, create_cross_section
+from src.geometry.model_creator import get_segment_dimension_arrays
+from src.geometry.section_view import CS_LABEL_STYLE, LENGTH_LABEL_STYLE, SECTION_LABEL_STYLE, WIDTH_LABEL_STYLE, create_section_view
 
 if TYPE_CHECKING:
     pass
 
+_HORIZONTAL_SECTION_LAYOUT: dict[str, Any] = {
+    "title": {"text": "Horizontale doorsnede (Horizontal Section)"},
+    "autosize": True,
+    "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
+    "xaxis": {"title": {"text": "X-as - Lengte [m]"}},
+    "yaxis": {"title": {"text": "Y-as - Breedte [m]"}},
+}
 
-def create_horizontal_section_annotations(params: dict | Munch, all_y: list[float]) -> list[go.layout.Annotation]:
+# The width labels stand upright next to the zones they measure
+_WIDTH_LABEL_STYLE: dict[str, Any] = {**WIDTH_LABEL_STYLE, "textangle": -90}
+
+
+def create_horizontal_section_annotations(params: dict | Munch, all_y: list[float] | np.ndarray) -> list[dict[str, Any]]:
     """
-    Create Plotly annotation objects for the horizontal section view.
+    Create Plotly annotations for the horizontal section view.
 
     :param params: Input parameters for the bridge dimensions.
     :type params: dict | Munch
-    :param all_y: List of all y-coordinates in the section.
-    :type all_y: list[float]
-    :returns: List of Plotly annotation objects for the horizontal section.
-    :rtype: list[go.layout.Annotation]
+    :param all_y: All y-coordinates in the section.
+    :type all_y: list[float] | np.ndarray
+    :returns: List of Plotly annotation dicts for the horizontal section.
+    :rtype: list[dict[str, Any]]
     """
     if not isinstance(params, Munch):
         params = Munch.fromDict(params)
@@ -30,172 +42,62 @@ def create_horizontal_section_annotations(params: dict | Munch, all_y: list[floa
     if params.input.dimensions.horizontal_section_loc >= 0:
         only_zone2 = True
 
-    row_labels = list(range(len(params.bridge_segments_array)))
-    l_values = []
-    l_values_cumulative = []
-    l_cumulative = 0
-    b_values_1 = []
-    b_values_2 = []
-    b_values_3 = []
-    zone1_center_y = []
-    zone2_center_y = []
-    zone3_center_y = []
+    segments = params.bridge_segments_array
+    row_labels = list(range(len(segments)))
+    # Label positions are computed on the dimension arrays; the label texts show the values as entered
+    dims = get_segment_dimension_arrays(segments)
+    l_values_cumulative = dims.length_cumulative
+    zone1_center_y = dims.bz2 / 2 + dims.bz1 / 2
+    zone2_center_y = np.zeros(len(segments))
+    zone3_center_y = -dims.bz2 / 2 - dims.bz3 / 2
 
-    for segment in params.bridge_segments_array:
-        l_values.append(segment.l)
-        l_cumulative += segment.l
-        l_values_cumulative.append(l_cumulative)
-        b_values_1.append(segment.bz1)
-        b_values_2.append(segment.bz2)
-        b_values_3.append(segment.bz3)
-        zone1_center_y.append(segment.bz2 / 2 + segment.bz1 / 2)
-        zone2_center_y.append(0)
-        zone3_center_y.append(-segment.bz2 / 2 - segment.bz3 / 2)
-
-    zone_center_x = [cum + val / 2 for cum, val in zip(l_values_cumulative, l_values[1:])]
+    zone_center_x = l_values_cumulative[:-1] + dims.length[1:] / 2
+    # Reduce the section extent once instead of rescanning it for every label
+    y_min, y_max = float(np.min(all_y)), float(np.max(all_y))
 
     cross_section_labels = [
-        go.layout.Annotation(
-            x=cs_x,
-            y=max(all_y) + 0.5,
-            text=f"<b>D-{i + 1}</b>",
-            showarrow=False,
-            font={"size": 15, "color": "black"},
-            align="center",
-            xanchor="center",
-            yanchor="bottom",
-            textangle=0,
-            ax=0,
-            ay=0,
-        )
-        for i, cs_x in zip(row_labels, l_values_cumulative)
+        {**CS_LABEL_STYLE, "x": cs_x, "y": y_max + 0.5, "text": f"<b>D-{i + 1}</b>"} for i, cs_x in zip(row_labels, l_values_cumulative)
     ]
     all_annotations.extend(cross_section_labels)
 
     zone_labels = []
     if not only_zone2:
         zone1_labels = [
-            go.layout.Annotation(
-                x=zcx,
-                y=cz1,
-                text=f"<b>Z1-{i + 1}</b>",
-                showarrow=False,
-                font={"size": 12, "color": "black"},
-                align="center",
-                xanchor="center",
-                yanchor="middle",
-                textangle=0,
-                ax=0,
-                ay=0,
-            )
+            {**SECTION_LABEL_STYLE, "x": zcx, "y": cz1, "text": f"<b>Z1-{i + 1}</b>"}
             for i, zcx, cz1 in zip(row_labels, zone_center_x, zone1_center_y)
         ]
         zone_labels.extend(zone1_labels)
     zone2_labels = [
-        go.layout.Annotation(
-            x=zcx,
-            y=cz2,
-            text=f"<b>Z2-{i + 1}</b>",
-            showarrow=False,
-            font={"size": 12, "color": "black"},
-            align="center",
-            xanchor="center",
-            yanchor="middle",
-            textangle=0,
-            ax=0,
-            ay=0,
-        )
-        for i, zcx, cz2 in zip(row_labels, zone_center_x, zone2_center_y)
+        {**SECTION_LABEL_STYLE, "x": zcx, "y": cz2, "text": f"<b>Z2-{i + 1}</b>"} for i, zcx, cz2 in zip(row_labels, zone_center_x, zone2_center_y)
     ]
     zone_labels.extend(zone2_labels)
     if not only_zone2:
         zone3_labels = [
-            go.layout.Annotation(
-                x=zcx,
-                y=cz3,
-                text=f"<b>Z3-{i + 1}</b>",
-                showarrow=False,
-                font={"size": 12, "color": "black"},
-                align="center",
-                xanchor="center",
-                yanchor="middle",
-                textangle=0,
-                ax=0,
-                ay=0,
-            )
+            {**SECTION_LABEL_STYLE, "x": zcx, "y": cz3, "text": f"<b>Z3-{i + 1}</b>"}
             for i, zcx, cz3 in zip(row_labels, zone_center_x, zone3_center_y)
         ]
         zone_labels.extend(zone3_labels)
     all_annotations.extend(zone_labels)
 
     dimension_annotations = [
-        go.layout.Annotation(
-            x=zcx,
-            y=min(all_y) - 1.0,
-            text=f"<b>l = {length}m</b>",
-            showarrow=False,
-            font={"size": 12, "color": "red"},
-            align="center",
-            xanchor="center",
-            yanchor="top",
-            textangle=0,
-            ax=0,
-            ay=0,
-        )
-        for length, zcx in zip(l_values[1:], zone_center_x)
+        {**LENGTH_LABEL_STYLE, "x": zcx, "y": y_min - 1.0, "text": f"<b>l = {segment.l}m</b>"} for segment, zcx in zip(segments[1:], zone_center_x)
     ]
     all_annotations.extend(dimension_annotations)
 
     if not only_zone2:
         width_annotations_zone1 = [
-            go.layout.Annotation(
-                x=zcx - 1,
-                y=cz1,
-                text=f"<b>b = {bz1}m</b>",
-                showarrow=False,
-                font={"size": 12, "color": "green"},
-                align="center",
-                xanchor="center",
-                yanchor="middle",
-                textangle=-90,
-                ax=0,
-                ay=0,
-            )
-            for zcx, cz1, bz1 in zip(l_values_cumulative, zone1_center_y, b_values_1)
+            {**_WIDTH_LABEL_STYLE, "x": zcx - 1, "y": cz1, "text": f"<b>b = {segment.bz1}m</b>"}
+            for zcx, cz1, segment in zip(l_values_cumulative, zone1_center_y, segments)
         ]
         all_annotations.extend(width_annotations_zone1)
     width_annotations_zone2 = [
-        go.layout.Annotation(
-            x=zcx - 1,
-            y=cz2,
-            text=f"<b>b = {bz2}m</b>",
-            showarrow=False,
-            font={"size": 12, "color": "green"},
-            align="center",
-            xanchor="center",
-            yanchor="middle",
-            textangle=-90,
-            ax=0,
-            ay=0,
-        )
-        for zcx, cz2, bz2 in zip(l_values_cumulative, zone2_center_y, b_values_2)
+        {**_WIDTH_LABEL_STYLE, "x": zcx - 1, "y": cz2, "text": f"<b>b = {segment.bz2}m</b>"}
+        for zcx, cz2, segment in zip(l_values_cumulative, zone2_center_y, segments)
     ]
     if not only_zone2:
         width_annotations_zone3 = [
-            go.layout.Annotation(
-                x=zcx - 1,
-                y=cz3,
-                text=f"<b>b = {bz3}m</b>",
-                showarrow=False,
-                font={"size": 12, "color": "green"},
-                align="center",
-                xanchor="center",
-                yanchor="middle",
-                textangle=-90,
-                ax=0,
-                ay=0,
-            )
-            for zcx, cz3, bz3 in zip(l_values_cumulative, zone3_center_y, b_values_3)
+            {**_WIDTH_LABEL_STYLE, "x": zcx - 1, "y": cz3, "text": f"<b>b = {segment.bz3}m</b>"}
+            for zcx, cz3, segment in zip(l_values_cumulative, zone3_center_y, segments)
         ]
         all_annotations.extend(width_annotations_zone3)
     all_annotations.extend(width_annotations_zone2)
@@ -220,70 +122,17 @@ def create_horizontal_section_view(params: dict | Munch, section_loc: float) ->
     """
     if isinstance(params, dict) and not isinstance(params, Munch):
         params = Munch.fromDict(params)
-    # Generate the 3D model without coordinate axes
-    scene = create_3d_model(params, axes=False)
-    combined_mesh = trimesh.util.concatenate(scene.geometry.values())
-
     # Define the slicing plane for the horizontal section
     # The plane is horizontal (normal to z-axis) at the specified height
     plane_origin = [0, 0, section_loc]
     plane_normal = [0, 0, 1]
 
-    # Create the section by slicing the 3D model
-    combined_scene_2d = create_cross_section(combined_mesh, plane_origin, plane_normal, axes=False)
-    combined_scene_2d_mesh = trimesh.util.concatenate(combined_scene_2d.geometry.values())
-
-    # Extract vertices and entities from the sliced mesh
-    vertices = combined_scene_2d_mesh.vertices
-    entities = combined_scene_2d_mesh.entities
-
-    # Initialize the Plotly figure
-    fig = go.Figure()
-
-    # Collect all x and y coordinates to determine the plot range
-    all_x = []
-    all_y = []
-    for entity in entities:
-        points = entity.points
-        for point in points:
-            all_x.append(vertices[point][0])
-            all_y.append(vertices[point][1])
-
-    # Calculate plot ranges with padding for better visualization
-    x_range = [min(all_x) - 2, max(all_x) + 2]
-    y_range = [min(all_y) - 2, max(all_y) + 2]
-
-    # Create line traces for each entity in the section
-    for entity in entities:
-        x = []
-        y = []
-        points = entity.points
-        for point in points:
-            x.append(vertices[point][0])
-            y.append(vertices[point][1])
-
-        # Add each line segment to the plot
-        fig.add_trace(
-            go.Scatter(
-                x=x,
-                y=y,
-                mode="lines",
-                line={"color": "black"},  # Consistent black color for all lines
-            )
-        )
-
-    # Prepare annotations using the new function
-    all_annotations = create_horizontal_section_annotations(params, all_y)
-
-    # Configure the plot layout with appropriate ranges and labels
-    fig.update_layout(
-        title="Horizontale doorsnede (Horizontal Section)",
-        showlegend=False,
-        autosize=True,
-        xaxis={"range": x_range, "constrain": "domain", "title": "X-as - Lengte [m]"},
-        yaxis={"range": y_range, "scaleanchor": "x", "scaleratio": 1, "title": "Y-as - Breedte [m]"},
-        margin={"l": 50, "r": 50, "t": 50, "b": 50},
-        annotations=all_annotations,
+    # Draw length (x) against width (y); the annotations are placed relative to the section widths
+    return create_section_view(
+        params,
+        plane_origin,
+        plane_normal,
+        (0, 1),
+        _HORIZONTAL_SECTION_LAYOUT,
+        lambda points: create_horizontal_section_annotations(params, points[:, 1]),
     )
-
-    return fig
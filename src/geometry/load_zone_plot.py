@@ -290,10 +290,8 @@ def build_load_zones_figure(
     validation_messages = presentation_details.get("validation_messages")
     figure_title = presentation_details.get("figure_title", "Belastingzones")  # Provide default if get is used
 
-    fig = go.Figure()
-    if base_traces:
-        for trace in base_traces:
-            fig.add_trace(trace)
+    # Traces are collected first and added to the figure in one call; add_trace per trace re-processes the figure each time
+    traces: list[go.Scatter] = list(base_traces) if base_traces else []
 
     all_annotations: list[go.layout.Annotation] = []
     # Unpack bridge_geom for easier access
@@ -369,7 +367,7 @@ def build_load_zones_figure(
             appearance_props,
         )
         if fill_trace:
-            fig.add_trace(fill_trace)
+            traces.append(fill_trace)
 
         boundary_style: ZoneBoundaryLineStyle = {
             "line_color": appearance_props["line_color"],
@@ -383,8 +381,7 @@ def build_load_zones_figure(
             geometry=current_zone_geom_for_plotting,  # Pass the new geometry group
             style=boundary_style,
         )
-        for trace in boundary_traces:
-            fig.add_trace(trace)
+        traces.extend(boundary_traces)
 
         all_annotations.append(
             create_zone_main_label_annotation(
@@ -425,6 +422,7 @@ def build_load_zones_figure(
             )
         )
 
+    fig = go.Figure(data=traces)
     fig.update_layout(
         title_text=figure_title,
         xaxis_title="Afstand (m)",
@@ -4,8 +4,12 @@ and cross-sections, using the `trimesh` library. It also includes functionality
 generating a 3D representation of a bridge deck based on input parameters.
 """
 
+import json
+import threading
 from collections.abc import Sequence
+from concurrent.futures import Future
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 import trimesh
@@ -567,6 +571,49 @@ def create_black_dot(radius: float = 0.2) -> trimesh.Trimesh:
     return dot
 
 
+def create_section_path(
+    mesh: trimesh.Trimesh, plane_origin: Sequence[float] | np.ndarray, plane_normal: Sequence[float] | np.ndarray
+) -> trimesh.path.Path3D | None:
+    """
+    Slice a 3D mesh with a plane and return the intersection as line geometry.
+
+    Only the triangles crossing the plane are intersected. Use this instead of create_cross_section when
+    the section lines are needed directly, e.g. for plotting, rather than a scene to render.
+
+    Args:
+        mesh (trimesh.Trimesh): The 3D mesh to slice.
+        plane_origin (sequence or np.ndarray): A point on the slicing plane [x, y, z].
+        plane_normal (sequence or np.ndarray): The normal vector of the slicing plane [nx, ny, nz].
+
+    Returns:
+        trimesh.path.Path3D | None: The section lines, or None if the plane does not intersect the mesh.
+
+    """
+    return mesh.section(plane_origin=np.asarray(plane_origin), plane_normal=np.asarray(plane_normal))
+
+
+def get_section_line_coordinates(section_path: trimesh.path.Path3D) -> np.ndarray:
+    """
+    Collect the lines of a section into one coordinate array for plotting.
+
+    The points of all entities are stacked in order, with a row of NaN between consecutive entities, so the
+    whole section can be drawn as a single line trace (Plotly breaks the line at NaN).
+
+    Args:
+        section_path (trimesh.path.Path3D): The section lines, as returned by create_section_path.
+
+    Returns:
+        np.ndarray: Array of shape (n_points + n_entities - 1, 3) with the [x, y, z] coordinates.
+
+    """
+    entities = section_path.entities
+    points_per_entity = np.fromiter((len(entity.points) for entity in entities), dtype=np.int64, count=len(entities))
+    # Gather the points of all entities with a single fancy-indexing lookup
+    coords = section_path.vertices[np.concatenate([entity.points for entity in entities])]
+    # Insert a NaN row in front of the first point of every entity but the first
+    return np.insert(coords.astype(float), np.cumsum(points_per_entity)[:-1], np.nan, axis=0)
+
+
 def create_cross_section(mesh: trimesh.Trimesh, plane_origin: list | np.ndarray, plane_normal: list | np.ndarray, axes: bool = True) -> trimesh.Scene:
     """
     Create a cross-section of a 3D mesh by slicing it with a plane.
@@ -581,12 +628,8 @@ def create_cross_section(mesh: trimesh.Trimesh, plane_origin: list | np.ndarray,
         trimesh.path.Path3D: A 3D path representing the cross-section.
 
     """
-    # Ensure the plane origin and normal are numpy arrays
-    plane_origin = np.array(plane_origin)
-    plane_normal = np.array(plane_normal)
-
     # Slice the mesh with the specified plane
-    cross_section = mesh.section(plane_origin=plane_origin, plane_normal=plane_normal)
+    cross_section = create_section_path(mesh, plane_origin, plane_normal)
 
     combined_scene_2d = trimesh.Scene(cross_section)
 
@@ -816,13 +859,194 @@ def create_3d_model(params: (dict | Munch), axes: bool = True, section_planes: b
 
     # Add transparent section planes to visualize where the 2D sections will be taken
     # These planes help users understand the location of horizontal, longitudinal, and cross sections
-    if params.input.dimensions.toggle_sections and section_planes:
+    if section_planes and params.input.dimensions.toggle_sections:
         section_planes_scene = create_section_planes(params)
         combined_scene.add_geometry(section_planes_scene)
 
     return combined_scene
 
 
+def _params_cache_key(params: dict | Munch) -> str:
+    """Serializes the parameters to a canonical JSON string that can be used as a cache key."""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _geometry_cache_key(params: dict | Munch, section_planes: bool = False) -> str:
+    """
+    Serializes only the parameters that determine the model geometry to a canonical JSON string.
+
+    These are the bridge segments and the reinforcement; the section settings in input.dimensions are only
+    included when the section planes are part of the model. Changes to other inputs (load zones, section
+    locations for a model without planes, ...) therefore do not invalidate the cached model.
+    """
+    geometry_params = {key: params[key] for key in ("bridge_segments_array", "reinforcement_zones_array") if key in params}
+    geometry_input = {key: params["input"][key] for key in ("geometrie_wapening", "dimensions") if key in params.get("input", {})}
+    if not section_planes:
+        geometry_input.pop("dimensions", None)
+    if geometry_input:
+        geometry_params["input"] = geometry_input
+    return _params_cache_key(geometry_params)
+
+
+@lru_cache(maxsize=8)
+def _create_3d_model_from_key(geometry_key: str, axes: bool, section_planes: bool) -> trimesh.Scene:
+    """
+    Builds the 3D model from serialized geometry parameters (see _geometry_cache_key).
+
+    Views requested with the same geometry share one model build. The returned scene is shared between calls and must
+    not be modified by the caller.
+    """
+    return create_3d_model(Munch.fromDict(json.loads(geometry_key)), axes=axes, section_planes=section_planes)
+
+
+def _concatenate_meshes(meshes: list[trimesh.Trimesh]) -> trimesh.Trimesh:
+    """
+    Concatenates meshes into one mesh of their vertices and faces only.
+
+    Unlike trimesh.util.concatenate, the visuals, normals and metadata are not merged: the combined mesh is only
+    sliced. The vertex and face arrays are filled in place instead of stacked from per-mesh copies.
+    """
+    n_vertices = [len(mesh.vertices) for mesh in meshes]
+    n_faces = [len(mesh.faces) for mesh in meshes]
+    vertices = np.empty((sum(n_vertices), 3), dtype=np.float64)
+    faces = np.empty((sum(n_faces), 3), dtype=np.int64)
+    vertex_offset = face_offset = 0
+    for mesh, mesh_vertices, mesh_faces in zip(meshes, n_vertices, n_faces, strict=True):
+        vertices[vertex_offset : vertex_offset + mesh_vertices] = mesh.vertices
+        # Face indices are shifted past the vertices of the preceding meshes
+        np.add(mesh.faces, vertex_offset, out=faces[face_offset : face_offset + mesh_faces])
+        vertex_offset += mesh_vertices
+        face_offset += mesh_faces
+    # The parts are already valid meshes, so trimesh's vertex merging and cleanup are skipped
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
+@lru_cache(maxsize=8)
+def _create_combined_mesh_from_key(geometry_key: str) -> trimesh.Trimesh:
+    """
+    Concatenates the (cached) axis-less 3D model for serialized geometry parameters into one mesh.
+
+    This is the mesh the 2D section views slice. It is cached on the geometry-defining parameters only, so moving a
+    section location reuses the same mesh. The mesh is always a new concatenation, never a geometry of the cached
+    scene, so it is only touched by the section slices (see _SECTION_SLICE_LOCK) and must not be modified.
+    """
+    # Positional arguments, so the lookup hits the same cache entry as the axis-less GLB export
+    scene = _create_3d_model_from_key(geometry_key, False, False)
+    return _concatenate_meshes(list(scene.geometry.values()))
+
+
+# Combined mesh builds that are still running, so section views requested at the same time share one build
+_MESH_BUILDS_IN_FLIGHT: dict[str, Future[trimesh.Trimesh]] = {}
+_MESH_BUILDS_LOCK = threading.Lock()
+# Slicing fills trimesh's lazy per-mesh caches, which are not thread-safe, so the shared mesh is sliced by one
+# thread at a time
+_SECTION_SLICE_LOCK = threading.Lock()
+
+
+def _combined_mesh(geometry_key: str) -> trimesh.Trimesh:
+    """
+    Returns the combined mesh of serialized geometry parameters, building it on the first section view request.
+
+    A build that is still running in another request thread is waited for instead of started again. Finished
+    meshes are served by the _create_combined_mesh_from_key cache, so only running builds are tracked here.
+    """
+    with _MESH_BUILDS_LOCK:
+        future = _MESH_BUILDS_IN_FLIGHT.get(geometry_key)
+        is_builder = future is None
+        if future is None:
+            future = _MESH_BUILDS_IN_FLIGHT[geometry_key] = Future()
+
+    if is_builder:
+        try:
+            future.set_result(_create_combined_mesh_from_key(geometry_key))
+        except BaseException as error:
+            future.set_exception(error)
+        finally:
+            with _MESH_BUILDS_LOCK:
+                del _MESH_BUILDS_IN_FLIGHT[geometry_key]
+    # Raises the build error, if any, in every request that waited for it
+    return future.result()
+
+
+def _plane_cache_key(vector: Sequence[float] | np.ndarray) -> tuple[float, ...]:
+    """Rounds a plane vector to a hashable tuple, so float noise in the section location does not miss the cache."""
+    return tuple(round(float(component), 6) for component in vector)
+
+
+@lru_cache(maxsize=32)
+def _create_section_path_from_key(geometry_key: str, plane_origin: tuple[float, ...], plane_normal: tuple[float, ...]) -> trimesh.path.Path3D | None:
+    """Slices the cached combined mesh for serialized geometry parameters (see create_section_path_cached)."""
+    mesh = _combined_mesh(geometry_key)
+    with _SECTION_SLICE_LOCK:
+        return create_section_path(mesh, plane_origin, plane_normal)
+
+
+@lru_cache(maxsize=8)
+def _export_3d_model_glb_from_key(geometry_key: str, axes: bool, section_planes: bool) -> bytes:
+    """Exports the cached 3D model for serialized geometry parameters to GLB bytes."""
+    # Without normals the viewer computes flat normals, which is what the box geometry needs anyway. trimesh would
+    # otherwise include them whenever vertex normals happen to be cached on a mesh, growing the file by a third.
+    return trimesh.exchange.gltf.export_glb(_create_3d_model_from_key(geometry_key, axes, section_planes), include_normals=False)
+
+
+def create_section_path_cached(
+    params: dict | Munch, plane_origin: Sequence[float] | np.ndarray, plane_normal: Sequence[float] | np.ndarray
+) -> trimesh.path.Path3D | None:
+    """
+    Memoized version of create_section_path on the combined mesh of the bridge model.
+
+    Slices are cached per geometry and plane, so re-rendering a section view after changing e.g. the load zones
+    reuses the section lines. The returned path is shared between calls and must not be modified.
+
+    Args:
+        params (dict | Munch): Input parameters containing bridge dimensions and properties.
+        plane_origin (sequence or np.ndarray): A point on the slicing plane [x, y, z].
+        plane_normal (sequence or np.ndarray): The normal vector of the slicing plane [nx, ny, nz].
+
+    Returns:
+        trimesh.path.Path3D | None: The section lines, or None if the plane does not intersect the model.
+
+    """
+    return _create_section_path_from_key(_geometry_cache_key(params), _plane_cache_key(plane_origin), _plane_cache_key(plane_normal))
+
+
+def section_view_cache_key(params: dict | Munch) -> str:
+    """
+    Serializes the parameters the 2D section views depend on to a canonical JSON string.
+
+    These are the geometry parameters together with the section settings in input.dimensions, so a cached section
+    view stays valid as long as neither the bridge nor the section locations change.
+
+    Args:
+        params (dict | Munch): Input parameters containing bridge dimensions and properties.
+
+    Returns:
+        str: The cache key for the section views of these parameters.
+
+    """
+    return _geometry_cache_key(params, section_planes=True)
+
+
+def export_3d_model_glb_cached(params: dict | Munch, axes: bool = True, section_planes: bool = False) -> bytes:
+    """
+    Returns the 3D model exported as a binary glTF (GLB), cached per parameter set.
+
+    The model only carries vertex/face colors and untextured materials, so the GLB export is dominated by
+    buffer packing rather than image compression; caching the exported bytes skips that step entirely when
+    the same model is requested again.
+
+    Args:
+        params (dict | Munch): Input parameters containing bridge dimensions and properties.
+        axes (bool, optional): Whether to include coordinate axes and origin point in the scene. Defaults to True.
+        section_planes (bool, optional): Whether to include transparent section planes in the scene. Defaults to False.
+
+    Returns:
+        bytes: The GLB file contents.
+
+    """
+    return _export_3d_model_glb_from_key(_geometry_cache_key(params, section_planes), axes, section_planes)
+
+
 def create_2d_top_view(viktor_params: Munch) -> dict:  # noqa: C901, PLR0912, PLR0915
     """
     Creates a 2D representation of the bridge top view, including lines, zone labels,
@@ -834,7 +1058,7 @@ def create_2d_top_view(viktor_params: Munch) -> dict:  # noqa: C901, PLR0912, PL
 
     Returns:
         dict: A dictionary with "bridge_lines", "zone_annotations",
-              "dimension_texts", and "cross_section_labels".
+              "dimension_texts", "cross_section_labels" and "zone_polygons". All keys are always present.
 
     """
     # Access the dynamic array data, which VIKTOR makes available
@@ -1085,6 +1309,46 @@ class LoadZoneGeometryData:
     d_point_label_data: list[DPointLabel]
 
 
+@dataclass
+class SegmentDimensionArrays:
+    """Holds the dimensions of all bridge segments as arrays, with one element per segment."""
+
+    length: np.ndarray
+    length_cumulative: np.ndarray
+    bz1: np.ndarray
+    bz2: np.ndarray
+    bz3: np.ndarray
+    dz: np.ndarray
+    dz_2: np.ndarray
+
+
+def get_segment_dimension_arrays(segments: Sequence[Munch]) -> SegmentDimensionArrays:
+    """
+    Collects the dimensions of the bridge segments into NumPy arrays for vectorized calculations.
+
+    Args:
+        segments: The bridge segments (params.bridge_segments_array), each with l, bz1, bz2, bz3, dz and dz_2.
+
+    Returns:
+        A SegmentDimensionArrays object; length_cumulative holds the x-coordinate of each cross-section.
+
+    """
+
+    def column(name: str) -> np.ndarray:
+        return np.fromiter((segment[name] for segment in segments), dtype=np.float64, count=len(segments))
+
+    length = column("l")
+    return SegmentDimensionArrays(
+        length=length,
+        length_cumulative=np.cumsum(length),
+        bz1=column("bz1"),
+        bz2=column("bz2"),
+        bz3=column("bz3"),
+        dz=column("dz"),
+        dz_2=column("dz_2"),
+    )
+
+
 def prepare_load_zone_geometry_data(
     bridge_dimensions_array: Sequence[BridgeSegmentDimensions],
     label_y_offset: float = 1.5,  # Exposed parameter with default
@@ -0,0 +1,106 @@
+"""Shared rendering of the 2D section views (cross, longitudinal and horizontal) of the bridge."""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+import plotly.graph_objects as go
+from munch import Munch  # type: ignore[import-untyped]
+
+from src.common.plot_utils import create_section_line_trace
+from src.geometry.model_creator import create_section_path_cached, get_section_line_coordinates
+
+# Layout shared by the section views: no legend and true-to-scale axes
+_SECTION_LAYOUT_BASE: dict[str, Any] = {
+    "showlegend": False,
+    "xaxis": {"constrain": "domain"},
+    "yaxis": {"scaleanchor": "x", "scaleratio": 1},
+}
+
+# Label styles of the section views; each annotation adds its position and text
+SECTION_LABEL_STYLE: dict[str, Any] = {
+    "showarrow": False,
+    "font": {"size": 12, "color": "black"},
+    "align": "center",
+    "xanchor": "center",
+    "yanchor": "middle",
+    "textangle": 0,
+    "ax": 0,
+    "ay": 0,
+}
+CS_LABEL_STYLE: dict[str, Any] = {**SECTION_LABEL_STYLE, "font": {"size": 15, "color": "black"}, "yanchor": "bottom"}
+LENGTH_LABEL_STYLE: dict[str, Any] = {**SECTION_LABEL_STYLE, "font": {"size": 12, "color": "red"}, "yanchor": "top"}
+WIDTH_LABEL_STYLE: dict[str, Any] = {**SECTION_LABEL_STYLE, "font": {"size": 12, "color": "green"}}
+HEIGHT_LABEL_STYLE: dict[str, Any] = {**SECTION_LABEL_STYLE, "font": {"size": 12, "color": "blue"}, "xanchor": "right", "textangle": -90}
+
+# Shown instead of the section lines when the section plane does not cut the deck
+_OUTSIDE_DECK_ANNOTATION: dict[str, Any] = {
+    **SECTION_LABEL_STYLE,
+    "xref": "paper",
+    "yref": "paper",
+    "x": 0.5,
+    "y": 0.5,
+    "text": "<b>De doorsnede ligt buiten het brugdek</b>",
+}
+
+
+def create_section_view(  # noqa: PLR0913
+    params: dict | Munch,
+    plane_origin: Sequence[float],
+    plane_normal: Sequence[float],
+    axes_idx: tuple[int, int],
+    layout: dict[str, Any],
+    annotations_fn: Callable[[np.ndarray], list[dict[str, Any]]],
+) -> go.Figure:
+    """
+    Creates a 2D section view of the bridge by slicing the 3D model with a plane.
+
+    The section lines are drawn as one NaN-separated trace of the two coordinate axes in ``axes_idx``.
+    The axis ranges are taken from the section bounds with a padding of 2 m on each side. If the plane does
+    not cut the deck (e.g. a section location at the end of the bridge), the view only shows a note saying so.
+
+    Args:
+        params (dict | Munch): Input parameters for the bridge dimensions.
+        plane_origin (Sequence[float]): A point on the slicing plane.
+        plane_normal (Sequence[float]): Normal vector of the slicing plane.
+        axes_idx (tuple[int, int]): Indices of the model axes (0=x, 1=y, 2=z) shown as plot x- and y-axis.
+        layout (dict[str, Any]): View-specific layout (title, axis titles, margins), merged over the layout
+            shared by the section views.
+        annotations_fn (Callable[[np.ndarray], list[dict[str, Any]]]): Builds the annotations from the
+            section points (an (n, 3) array without NaN separators).
+
+    Returns:
+        go.Figure: A 2D representation of the section.
+
+    """
+    figure_layout = {
+        **_SECTION_LAYOUT_BASE,
+        **layout,
+        "xaxis": {**_SECTION_LAYOUT_BASE["xaxis"], **layout.get("xaxis", {})},
+        "yaxis": {**_SECTION_LAYOUT_BASE["yaxis"], **layout.get("yaxis", {})},
+    }
+
+    # Create the section by slicing the 3D model (cached per geometry and plane)
+    section_path = create_section_path_cached(params, plane_origin, plane_normal)
+    if section_path is None:
+        figure_layout["annotations"] = [_OUTSIDE_DECK_ANNOTATION]
+        return go.Figure(data=[], layout=figure_layout, _validate=False)
+
+    # Collect the section lines into one coordinate array, with NaN rows between the entities
+    coords = get_section_line_coordinates(section_path)
+
+    # Coordinates of the section points themselves (without the NaN separators) determine the plot range
+    points = coords[~np.isnan(coords[:, 0])]
+    lower, upper = points.min(axis=0), points.max(axis=0)
+    x_idx, y_idx = axes_idx
+
+    # Draw all section lines as a single trace; the NaN rows break the line between entities
+    traces = [create_section_line_trace(coords[:, x_idx], coords[:, y_idx])]
+
+    # Add the ranges (padded for better visualization) and annotations to the plot layout
+    figure_layout["xaxis"]["range"] = [float(lower[x_idx]) - 2, float(upper[x_idx]) + 2]
+    figure_layout["yaxis"]["range"] = [float(lower[y_idx]) - 2, float(upper[y_idx]) + 2]
+    figure_layout["annotations"] = annotations_fn(points)
+    # Traces, annotations and layout are plain dicts generated here, so Plotly's per-object validation is skipped;
+    # the layouts therefore give properties in their explicit nested form (e.g. {"title": {"text": ...}})
+    return go.Figure(data=traces, layout=figure_layout, _validate=False)
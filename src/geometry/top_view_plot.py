@@ -1,150 +1,170 @@
 """Module for creating the Plotly Figure for the Top View of the bridge."""
 
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
 
-# Assuming create_text_annotations_from_data is in src.common.plot_utils
-from src.common.plot_utils import create_text_annotations_from_data
-
+from src.common.plot_utils import create_bridge_outline_traces
+
+# Traces and annotations in this module are assembled as plain dicts rather than graph objects
+# (go.Scatter / go.layout.Annotation). The data is generated internally, so Plotly's per-object
+# validation and deep-copying is pure overhead; the figure is created once with validation disabled.
+
+# Static part of the top view layout; only the annotations differ per request.
+# Validation is skipped, so layout properties must be given in their explicit nested form
+# (e.g. {"title": {"text": ...}}) instead of Plotly's shorthand/magic-underscore notation.
+_TOP_VIEW_LAYOUT_BASE: dict[str, Any] = {
+    "title": {"text": "Bovenaanzicht (Top View)"},
+    "xaxis": {"title": {"text": "Length (m)"}},
+    "yaxis": {"title": {"text": "Width (m)"}, "scaleanchor": "x", "scaleratio": 1},
+    "showlegend": False,
+    "autosize": True,
+    "hovermode": "closest",
+    "margin": {"l": 20, "r": 20, "t": 100, "b": 20},
+    "plot_bgcolor": "white",
+}
+
+# Styles of the zone, cross-section (D-) and dimension labels of the top view
+_ZONE_LABEL_DEFAULTS: dict[str, Any] = {"showarrow": False, "font": {"size": 14, "color": "DarkSlateGray"}, "ax": 0, "ay": 0}
+_CS_LABEL_DEFAULTS: dict[str, Any] = {
+    "showarrow": False,
+    "font": {"size": 15, "color": "black"},
+    "align": "center",
+    "xanchor": "center",
+    "yanchor": "bottom",
+}
+_DIM_LABEL_DEFAULTS: dict[str, Any] = {"showarrow": False, "font": {"size": 12, "color": "red"}, "ax": 0, "ay": 0}
+
+# Anchoring of dimension labels. The text angle takes precedence over the label type;
+# labels matching neither (usually width labels) fall back to the default.
+_DIM_TEXT_STYLE_BY_ANGLE: dict[Any, dict[str, str]] = {
+    180: {"xanchor": "right", "yanchor": "middle", "align": "right"},
+    90: {"xanchor": "center", "yanchor": "middle", "align": "center"},
+    -90: {"xanchor": "center", "yanchor": "middle", "align": "center"},
+}
+_DIM_TEXT_STYLE_BY_TYPE: dict[Any, dict[str, str]] = {
+    "length": {"xanchor": "center", "yanchor": "bottom", "align": "center"},
+}
+_DIM_TEXT_STYLE_DEFAULT = {"xanchor": "left", "yanchor": "middle", "align": "left"}
+
+# Unpacks the geometric data returned by create_2d_top_view, which always contains all of these keys
+_get_top_view_data = itemgetter("zone_polygons", "bridge_lines", "zone_annotations", "dimension_texts", "cross_section_labels")
+
+# Break between separate shapes batched into one trace
+_NAN_BREAK = np.full((1, 2), np.nan, dtype=np.float32)
+
+
+def _create_zone_polygon_traces(zone_polygons_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Creates structural zone polygon traces, one trace per fill color.
 
-def _add_zone_polygon_traces(fig: go.Figure, zone_polygons_data: list[dict[str, Any]]) -> None:
-    """Adds structural zone polygon traces to the figure."""
+    Polygons sharing a color are merged into a single trace, separated by NaN; Plotly fills
+    each NaN-separated part as its own shape with `fill="toself"`.
+    """
+    rings_by_color: dict[str, list[np.ndarray]] = {}
     for poly in zone_polygons_data:
         vertices = poly.get("vertices", [])
         if vertices:
-            x_coords = [v[0] for v in vertices] + [vertices[0][0]]
-            y_coords = [v[1] for v in vertices] + [vertices[0][1]]
-            fig.add_trace(
-                go.Scatter(
-                    x=x_coords,
-                    y=y_coords,
-                    mode="lines",
-                    fill="toself",
-                    fillcolor=poly.get("color", "rgba(128,128,128,0.1)"),
-                    line={"width": 0},
-                    hoverinfo="skip",
-                    showlegend=False,
-                )
-            )
-
-
-def _add_bridge_outline_traces(fig: go.Figure, bridge_lines_data: list[dict[str, Any]]) -> None:
-    """Adds bridge outline traces to the figure."""
-    for i, line_segment in enumerate(bridge_lines_data):
-        fig.add_trace(
-            go.Scatter(
-                x=[line_segment["start"][0], line_segment["end"][0]],
-                y=[line_segment["start"][1], line_segment["end"][1]],
-                mode="lines",
-                line={"color": "blue", "width": 2},
-                hoverinfo="none",
-                showlegend=False,
-                name=f"Bridge Outline Segment {i}",
-            )
-        )
+            rings = rings_by_color.setdefault(poly.get("color", "rgba(128,128,128,0.1)"), [])
+            if rings:
+                rings.append(_NAN_BREAK)
+            verts = np.asarray(vertices, dtype=np.float32)[:, :2]
+            rings.append(np.concatenate((verts, verts[:1])))  # Close the ring with the first vertex
 
+    coords_by_color = {color: np.concatenate(rings) for color, rings in rings_by_color.items()}
 
-def _create_zone_label_annotations(zone_annotations_data: list[dict[str, Any]]) -> list[go.layout.Annotation]:
-    """Creates annotations for structural zone labels."""
     return [
-        go.layout.Annotation(
-            x=ann["x"],
-            y=ann["y"],
-            text=f"<b>{ann['text']}</b>",
-            showarrow=False,
-            font={"size": 14, "color": "DarkSlateGray"},
-            ax=0,
-            ay=0,
-        )
-        for ann in zone_annotations_data
+        {
+            "type": "scatter",
+            # float32 arrays are sent to Plotly.js as base64-encoded typed arrays instead of JSON number lists
+            "x": coords[:, 0],
+            "y": coords[:, 1],
+            "mode": "lines",
+            "fill": "toself",
+            "fillcolor": color,
+            "line": {"width": 0},
+            "hoverinfo": "skip",
+            "showlegend": False,
+        }
+        for color, coords in coords_by_color.items()
     ]
 
 
-def _create_dimension_text_annotations(dimension_texts_data: list[dict[str, Any]]) -> list[go.layout.Annotation]:
-    """Creates annotations for dimension value labels."""
-    annotations = []
-    for dim_text in dimension_texts_data:
-        text_align = "center"
-        xanchor = "center"
-        yanchor = "middle"
-        current_textangle = dim_text.get("textangle", 0)
-
-        if current_textangle == 180:
-            xanchor = "right"
-            yanchor = "middle"
-            text_align = "right"
-        elif current_textangle in (90, -90):
-            xanchor = "center"
-            yanchor = "middle"
-            text_align = "center"
-        elif dim_text.get("type") == "length":
-            text_align = "center"
-            xanchor = "center"
-            yanchor = "bottom"
-        else:  # Default for width type usually
-            text_align = "left"
-            xanchor = "left"
-            yanchor = "middle"
+def _create_zone_label_annotations(zone_annotations_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Creates annotations for structural zone labels."""
+    return [{**_ZONE_LABEL_DEFAULTS, "x": ann["x"], "y": ann["y"], "text": f"<b>{ann['text']}</b>"} for ann in zone_annotations_data]
 
-        annotations.append(
-            go.layout.Annotation(
-                x=dim_text["x"],
-                y=dim_text["y"],
-                text=f"<b>{dim_text['text']}</b>",
-                showarrow=False,
-                font={"size": 12, "color": "red"},
-                align=text_align,
-                xanchor=xanchor,
-                yanchor=yanchor,
-                textangle=current_textangle,
-                ax=0,
-                ay=0,
-            )
-        )
-    return annotations
 
+def _create_cross_section_label_annotations(cross_section_labels_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Creates annotations for the cross-section labels."""
+    return [{**_CS_LABEL_DEFAULTS, "x": label["x"], "y": label["y"], "text": f"<b>{label['text']}</b>"} for label in cross_section_labels_data]
 
-def _create_validation_warning_annotations(validation_messages: list[str]) -> list[go.layout.Annotation]:
+
+def _dimension_text_style(dim_text: dict[str, Any]) -> dict[str, str]:
+    """Looks up the xanchor, yanchor and align of a dimension label by its text angle, then by its type."""
+    style = _DIM_TEXT_STYLE_BY_ANGLE.get(dim_text.get("textangle", 0))
+    if style is None:
+        style = _DIM_TEXT_STYLE_BY_TYPE.get(dim_text.get("type"), _DIM_TEXT_STYLE_DEFAULT)
+    return style
+
+
+def _create_dimension_text_annotations(dimension_texts_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Creates annotations for dimension value labels."""
+    return [
+        {
+            **_DIM_LABEL_DEFAULTS,
+            **_dimension_text_style(dim_text),
+            "x": dim_text["x"],
+            "y": dim_text["y"],
+            "text": f"<b>{dim_text['text']}</b>",
+            "textangle": dim_text.get("textangle", 0),
+        }
+        for dim_text in dimension_texts_data
+    ]
+
+
+def _create_validation_warning_annotations(validation_messages: list[str]) -> list[dict[str, Any]]:
     """Creates annotations for validation warning messages."""
     annotations = []
     if validation_messages:
         consolidated_warning_text = "<br>".join([f"<b>Waarschuwing (Belastingzones):</b> {msg}" for msg in validation_messages])
         annotations.append(
-            go.layout.Annotation(
-                text=consolidated_warning_text,
-                align="left",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.0,
-                y=-0.12,
-                xanchor="left",
-                yanchor="top",
-                font={"color": "orangered", "size": 13},
-                bgcolor="rgba(255, 224, 153, 0.85)",
-                borderpad=0,
-                width=900,
-            )
+            {
+                "text": consolidated_warning_text,
+                "align": "left",
+                "showarrow": False,
+                "xref": "paper",
+                "yref": "paper",
+                "x": 0.0,
+                "y": -0.12,
+                "xanchor": "left",
+                "yanchor": "top",
+                "font": {"color": "orangered", "size": 13},
+                "bgcolor": "rgba(255, 224, 153, 0.85)",
+                "borderpad": 0,
+                "width": 900,
+            }
         )
     return annotations
 
 
-def _create_north_arrow_annotation() -> list[go.layout.Annotation]:
+def _create_north_arrow_annotation() -> list[dict[str, Any]]:
     """Creates a horizontal span arrow annotation above the plot title."""
     return [
-        go.layout.Annotation(
-            text="⥊",  # Unicode right-pointing double-headed arrow
-            x=0.9,  # Center of the plot
-            y=1.05,  # Just above the title
-            xref="paper",
-            yref="paper",
-            showarrow=False,
-            font={"size": 75, "color": "black"},
-            align="center",
-            xanchor="center",
-            yanchor="middle",
-        )
+        {
+            "text": "⥊",  # Unicode right-pointing double-headed arrow
+            "x": 0.9,  # Center of the plot
+            "y": 1.05,  # Just above the title
+            "xref": "paper",
+            "yref": "paper",
+            "showarrow": False,
+            "font": {"size": 75, "color": "black"},
+            "align": "center",
+            "xanchor": "center",
+            "yanchor": "middle",
+        }
     ]
 
 
@@ -153,7 +173,9 @@ def build_top_view_figure(top_view_geometric_data: dict[str, Any], validation_me
     Builds the Plotly Figure for the 2D Top View of the bridge deck.
 
     Args:
-        top_view_geometric_data: A dictionary containing pre-calculated geometric data.
+        top_view_geometric_data: A dictionary containing pre-calculated geometric data, as returned by
+            create_2d_top_view (keys "zone_polygons", "bridge_lines", "zone_annotations", "dimension_texts"
+            and "cross_section_labels").
         validation_messages: A list of warning message strings to display on the plot.
 
     Returns:
@@ -163,42 +185,21 @@ def build_top_view_figure(top_view_geometric_data: dict[str, Any], validation_me
     if validation_messages is None:
         validation_messages = []
 
-    fig = go.Figure()
-    all_annotations: list[go.layout.Annotation] = []
+    zone_polygons, bridge_lines, zone_annotations, dimension_texts, cs_labels_data = _get_top_view_data(top_view_geometric_data)
 
-    _add_zone_polygon_traces(fig, top_view_geometric_data.get("zone_polygons", []))
-    _add_bridge_outline_traces(fig, top_view_geometric_data.get("bridge_lines", []))
+    traces: list[dict[str, Any]] = []
+    all_annotations: list[dict[str, Any]] = []
 
-    all_annotations.extend(_create_zone_label_annotations(top_view_geometric_data.get("zone_annotations", [])))
-    all_annotations.extend(_create_dimension_text_annotations(top_view_geometric_data.get("dimension_texts", [])))
+    traces.extend(_create_zone_polygon_traces(zone_polygons))
+    traces.extend(create_bridge_outline_traces(bridge_lines, color="blue", width=2, name="Bridge Outline", as_dict=True))
+
+    all_annotations.extend(_create_zone_label_annotations(zone_annotations))
+    all_annotations.extend(_create_dimension_text_annotations(dimension_texts))
     # Add span arrows
     all_annotations.extend(_create_north_arrow_annotation())
 
-    cs_labels_data = top_view_geometric_data.get("cross_section_labels", [])
-    if cs_labels_data:
-        all_annotations.extend(
-            create_text_annotations_from_data(
-                label_data=cs_labels_data,
-                font_size=15,
-                font_color="black",
-                align="center",
-                xanchor="center",
-                yanchor="bottom",
-            )
-        )
-
+    all_annotations.extend(_create_cross_section_label_annotations(cs_labels_data))
     all_annotations.extend(_create_validation_warning_annotations(validation_messages))
 
-    fig.update_layout(
-        title="Bovenaanzicht (Top View)",
-        xaxis_title="Length (m)",
-        yaxis_title="Width (m)",
-        showlegend=False,
-        autosize=True,
-        hovermode="closest",
-        yaxis={"scaleanchor": "x", "scaleratio": 1},
-        annotations=all_annotations,
-        margin={"l": 20, "r": 20, "t": 100, "b": 20},
-        plot_bgcolor="white",
-    )
-    return fig
+    layout = {**_TOP_VIEW_LAYOUT_BASE, "annotations": all_annotations}
+    return go.Figure(data=traces, layout=layout, _validate=False)
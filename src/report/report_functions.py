@@ -1,6 +1,7 @@
 """Functions for generating reports."""
 
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from zoneinfo import ZoneInfo
 
@@ -34,21 +35,40 @@ def create_export_report(params: Munch) -> File:
         OSError: If there are issues accessing the template or saving temporary files.
 
     """
-    # Load the template
-    doc = DocxTemplate(OUTPUT_REPORT_PATH)  # Create the context dict for the template
     context = {
         "BRIDGE_ID": params.info.bridge_objectnumm,
         "DATE": datetime.now(tz=ZoneInfo("Europe/Amsterdam")).strftime("%d-%m-%Y"),
         # Add more template variables as needed
     }
+    # The Word to PDF conversion takes seconds, so the PDF is cached per template version and context
+    pdf_data = _render_report_pdf(OUTPUT_REPORT_PATH.stat().st_mtime, tuple(sorted(context.items())))
+    return File.from_data(pdf_data)
+
+
+@lru_cache(maxsize=8)
+def _render_report_pdf(template_mtime: float, context_items: tuple[tuple[str, str], ...]) -> bytes:  # noqa: ARG001
+    """
+    Render the Word template with the given context and convert it to PDF.
+
+    Args:
+        template_mtime: Modification time of the template, only part of the cache key so edits to the template
+            invalidate cached reports.
+        context_items: The template context as sorted (key, value) pairs.
+
+    Returns:
+        bytes: The PDF file contents.
+
+    """
+    # Load the template
+    doc = DocxTemplate(OUTPUT_REPORT_PATH)
 
     # Render the template
-    doc.render(context)
+    doc.render(dict(context_items))
 
     # Save the rendered document to a BytesIO object
     doc_binary = BytesIO()
     doc.save(doc_binary)
-    doc_binary.seek(0)  # Reset pointer to start of buffer    # Convert to PDF
-    file = File.from_data(doc_binary.read())
-    with file.open_binary() as f:
-        return convert_word_to_pdf(f)
+    doc_binary.seek(0)  # Reset pointer to start of buffer
+
+    # Convert to PDF; the buffer is passed directly, without copying it into a File first
+    return convert_word_to_pdf(doc_binary).getvalue_binary()
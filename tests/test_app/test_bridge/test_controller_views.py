@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from app.bridge.controller import BridgeController
+from app.bridge.utils import _section_view_json_from_key
 from tests.test_data.seed_loader import load_bridge_complex_params, load_bridge_default_params
 from tests.test_utils import view_test_wrapper
 
@@ -20,6 +21,16 @@ class TestBridgeControllerViews(unittest.TestCase):
         self.controller = BridgeController()
         self.default_params = load_bridge_default_params()
         self.complex_params = load_bridge_complex_params()
+        _section_view_json_from_key.cache_clear()
+
+    def _assert_section_view_called_once(self, mock_create_view: MagicMock, section_loc: float) -> None:
+        """Assert that a section view was created once, from the section parameters and at the given location."""
+        mock_create_view.assert_called_once()
+        view_params, view_section_loc = mock_create_view.call_args.args
+        # The cached section views are created from the parameters they depend on (see section_view_json_cached)
+        assert view_params.bridge_segments_array == self.default_params.bridge_segments_array
+        assert view_params.input.dimensions == self.default_params.input.dimensions
+        assert view_section_loc == section_loc
 
     def test_view_methods_exist(self) -> None:
         """Test that all view methods exist and are callable."""
@@ -53,14 +64,11 @@ class TestBridgeControllerViews(unittest.TestCase):
     # PHASE 2: Full View Execution Tests - Bypassing VIKTOR Decorators
     # ============================================================================================================
 
-    @patch("app.bridge.controller.create_3d_model")
-    @patch("trimesh.exchange.gltf.export_glb")
+    @patch("app.bridge.controller.export_3d_model_glb_cached")
     @view_test_wrapper("get_3d_view")
-    def test_get_3d_view_execution(self, mock_export_glb: MagicMock, mock_create_3d: MagicMock) -> None:
+    def test_get_3d_view_execution(self, mock_export_glb: MagicMock) -> None:
         """Test actual execution of get_3d_view with mocked dependencies."""
         # Arrange
-        mock_scene = MagicMock()
-        mock_create_3d.return_value = mock_scene
         mock_export_glb.return_value = b"fake_gltf_data"
 
         # Access the original method directly
@@ -73,8 +81,26 @@ class TestBridgeControllerViews(unittest.TestCase):
         from viktor.views import GeometryResult
 
         assert isinstance(result, GeometryResult)
-        mock_create_3d.assert_called_once_with(self.default_params, section_planes=True)
-        mock_export_glb.assert_called_once_with(mock_scene)
+        mock_export_glb.assert_called_once_with(self.default_params, section_planes=True)
+
+    @view_test_wrapper("get_3d_view")
+    def test_get_3d_view_leaves_section_mesh_unbuilt(self) -> None:
+        """Test that a 3D view request does not build the section mesh, which is left to the section views."""
+        from src.geometry import model_creator
+
+        # Arrange
+        model_creator._create_combined_mesh_from_key.cache_clear()  # noqa: SLF001
+        # The seed has no reinforcement input, which the real model build needs
+        self.default_params.input.geometrie_wapening.update(dekking_onder=55.0, dekking_boven=55.0)
+        self.default_params.reinforcement_zones_array = []
+
+        # Act
+        with patch.object(model_creator, "_create_combined_mesh_from_key", wraps=model_creator._create_combined_mesh_from_key) as mock_mesh:  # noqa: SLF001
+            self.controller.__class__.get_3d_view(self.controller, self.default_params)
+
+        # Assert
+        mock_mesh.assert_not_called()
+        assert model_creator._create_combined_mesh_from_key.cache_info().currsize == 0  # noqa: SLF001
 
     @patch("app.bridge.controller.build_top_view_figure")
     @patch("app.bridge.controller.create_2d_top_view")
@@ -88,7 +114,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         mock_validate_widths.return_value = []
 
         mock_fig = Mock()
-        mock_fig.to_json.return_value = '{"data": [], "layout": {}}'
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {}}
         mock_build_figure.return_value = mock_fig
 
         # Access the original method directly
@@ -115,7 +141,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         """Test actual execution of get_2d_horizontal_section."""
         # Arrange
         mock_fig = Mock()
-        mock_fig.to_json.return_value = '{"data": [], "layout": {"title": "Horizontal Section"}}'
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {"title": "Horizontal Section"}}
         mock_create_horizontal.return_value = mock_fig
 
         # Access the original method directly
@@ -128,7 +154,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         from viktor.views import PlotlyResult
 
         assert isinstance(result, PlotlyResult)
-        mock_create_horizontal.assert_called_once_with(self.default_params, self.default_params.input.dimensions.horizontal_section_loc)
+        self._assert_section_view_called_once(mock_create_horizontal, self.default_params.input.dimensions.horizontal_section_loc)
 
         # Verify JSON result - PlotlyResult stores figure in .figure attribute
         json_result = json.loads(result.figure)
@@ -140,7 +166,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         """Test actual execution of get_2d_longitudinal_section."""
         # Arrange
         mock_fig = Mock()
-        mock_fig.to_json.return_value = '{"data": [], "layout": {"title": "Longitudinal Section"}}'
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {"title": "Longitudinal Section"}}
         mock_create_longitudinal.return_value = mock_fig
 
         # Access the original method directly
@@ -153,7 +179,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         from viktor.views import PlotlyResult
 
         assert isinstance(result, PlotlyResult)
-        mock_create_longitudinal.assert_called_once_with(self.default_params, self.default_params.input.dimensions.longitudinal_section_loc)
+        self._assert_section_view_called_once(mock_create_longitudinal, self.default_params.input.dimensions.longitudinal_section_loc)
 
     @patch("app.bridge.controller.create_cross_section_view")
     @view_test_wrapper("get_2d_cross_section")
@@ -161,7 +187,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         """Test actual execution of get_2d_cross_section."""
         # Arrange
         mock_fig = Mock()
-        mock_fig.to_json.return_value = '{"data": [], "layout": {"title": "Cross Section"}}'
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {"title": "Cross Section"}}
         mock_create_cross.return_value = mock_fig
 
         # Access the original method directly
@@ -174,7 +200,28 @@ class TestBridgeControllerViews(unittest.TestCase):
         from viktor.views import PlotlyResult
 
         assert isinstance(result, PlotlyResult)
-        mock_create_cross.assert_called_once_with(self.default_params, self.default_params.input.dimensions.cross_section_loc)
+        self._assert_section_view_called_once(mock_create_cross, self.default_params.input.dimensions.cross_section_loc)
+
+    @patch("app.bridge.controller.create_cross_section_view")
+    @view_test_wrapper("get_2d_cross_section")
+    def test_get_2d_cross_section_reuses_cached_json(self, mock_create_cross: MagicMock) -> None:
+        """Test that an unchanged cross-section is served from the cached JSON."""
+        mock_fig = Mock()
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {"title": "Cross Section"}}
+        mock_create_cross.return_value = mock_fig
+        original_method = self.controller.__class__.get_2d_cross_section
+
+        first_result = original_method(self.controller, self.default_params)
+        # Inputs the section views do not depend on do not invalidate the cached JSON
+        self.default_params.load_zones_data_array = []
+        second_result = original_method(self.controller, self.default_params)
+
+        assert second_result.figure == first_result.figure
+        mock_create_cross.assert_called_once()
+
+        self.default_params.input.dimensions.cross_section_loc += 1.0
+        original_method(self.controller, self.default_params)
+        assert mock_create_cross.call_count == 2
 
     @patch("app.bridge.controller.build_load_zones_figure")
     @view_test_wrapper("get_load_zones_view")
@@ -182,7 +229,7 @@ class TestBridgeControllerViews(unittest.TestCase):
         """Test actual execution of get_load_zones_view with load zones present."""
         # Arrange
         mock_fig = Mock()
-        mock_fig.to_json.return_value = '{"data": [], "layout": {"title": "Load Zones"}}'
+        mock_fig.to_plotly_json.return_value = {"data": [], "layout": {"title": "Load Zones"}}
         mock_build_zones.return_value = mock_fig
 
         # Access the original method directly
@@ -259,12 +306,12 @@ class TestBridgeControllerViews(unittest.TestCase):
     # Error Handling Tests
     # ============================================================================================================
 
-    @patch("app.bridge.controller.create_3d_model")
+    @patch("app.bridge.controller.export_3d_model_glb_cached")
     @view_test_wrapper("get_3d_view")
-    def test_get_3d_view_error_handling(self, mock_create_3d: MagicMock) -> None:
+    def test_get_3d_view_error_handling(self, mock_export_glb: MagicMock) -> None:
         """Test error handling in get_3d_view when 3D model creation fails."""
         # Arrange
-        mock_create_3d.side_effect = Exception("3D model creation failed")
+        mock_export_glb.side_effect = Exception("3D model creation failed")
 
         # Access the original method directly
         original_method = self.controller.__class__.get_3d_view
@@ -1,124 +1,22 @@
 """
 Test module for common plotting utilities.
 
-This module contains tests for creating plotly annotations, structural polygon traces,
-and bridge outline traces used across the application.
+This module contains tests for creating structural polygon traces,
+bridge outline traces and section line traces used across the application.
 """
 
 import unittest
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
 
-from src.common.plot_utils import create_bridge_outline_traces, create_structural_polygons_traces, create_text_annotations_from_data
-
-
-class TestPlotUtilsCreateTextAnnotations(unittest.TestCase):
-    """Test cases for create_text_annotations function."""
-
-    def test_empty_label_data(self) -> None:
-        """Test create_text_annotations with empty input data."""
-        # Arrange
-        label_data: list[dict[str, Any]] = []
-        # Act
-        annotations = create_text_annotations_from_data(label_data)
-        # Assert
-        assert len(annotations) == 0
-        assert isinstance(annotations, list)
-
-    def test_single_annotation_defaults(self) -> None:
-        """Test create_text_annotations with single annotation using default styling."""
-        # Arrange
-        label_data = [{"text": "Test1", "x": 10, "y": 20}]
-        # Act
-        annotations = create_text_annotations_from_data(label_data)
-        # Assert
-        assert len(annotations) == 1
-        ann = annotations[0]
-        assert isinstance(ann, go.layout.Annotation)
-        assert ann.text == "<b>Test1</b>"
-        assert ann.x == 10
-        assert ann.y == 20
-        assert ann.font.size == 12
-        assert ann.font.color == "black"
-        assert ann.xanchor == "center"
-        assert ann.yanchor == "bottom"
-        assert not ann.showarrow
-
-    def test_multiple_annotations(self) -> None:
-        """Test create_text_annotations with multiple annotations."""
-        # Arrange
-        label_data = [
-            {"text": "TestA", "x": 1, "y": 2},
-            {"text": "TestB", "x": 3, "y": 4},
-        ]
-        # Act
-        annotations = create_text_annotations_from_data(label_data)
-        # Assert
-        assert len(annotations) == 2
-        assert annotations[0].text == "<b>TestA</b>"
-        assert annotations[0].x == 1
-        assert annotations[1].text == "<b>TestB</b>"
-        assert annotations[1].y == 4
-
-    def test_overridden_optional_arguments(self) -> None:
-        """Test create_text_annotations with overridden optional styling arguments."""
-        # Arrange
-        label_data = [{"text": "Override", "x": 5, "y": 15}]
-        font_size = 16
-        font_color = "red"
-        xanchor = "left"
-        yanchor = "top"
-        showarrow = True
-        text_prefix = "<i>"
-        text_suffix = "</i>"
-        # Act
-        annotations = create_text_annotations_from_data(
-            label_data,
-            font_size=font_size,
-            font_color=font_color,
-            xanchor=xanchor,
-            yanchor=yanchor,
-            showarrow=showarrow,
-            text_prefix=text_prefix,
-            text_suffix=text_suffix,
-        )
-        # Assert
-        assert len(annotations) == 1
-        ann = annotations[0]
-        assert ann.text == "<i>Override</i>"
-        assert ann.font.size == font_size
-        assert ann.font.color == font_color
-        assert ann.xanchor == xanchor
-        assert ann.yanchor == yanchor
-        assert ann.showarrow == showarrow
-
-    def test_kwargs_passthrough(self) -> None:
-        """Test create_text_annotations passes through additional kwargs correctly."""
-        # Arrange
-        label_data = [{"text": "Kwargs", "x": 1, "y": 1}]
-
-        # Act
-        annotations = create_text_annotations_from_data(label_data, bordercolor="red", font_color="black")
-
-        # Assert
-        ann = annotations[0]
-        assert ann.bordercolor == "red"
-        assert ann.font.color == "black"
-
-    def test_mixed_default_and_overridden_kwargs(self) -> None:
-        """Test create_text_annotations with mix of default and overridden arguments."""
-        # Arrange
-        label_data = [{"text": "Mixed", "x": 0, "y": 0}]
-        # Override one default, pass one kwarg
-        # Act
-        annotations = create_text_annotations_from_data(label_data, font_size=20, arrowwidth=2)
-        # Assert
-        ann = annotations[0]
-        assert ann.font.size == 20  # Overridden
-        assert ann.font.color == "black"  # Default
-        assert ann.arrowwidth == 2  # Kwarg
-        assert ann.xanchor == "center"  # Default
+from src.common.plot_utils import (
+    WEBGL_POINT_THRESHOLD,
+    create_bridge_outline_traces,
+    create_section_line_trace,
+    create_structural_polygons_traces,
+)
 
 
 class TestPlotUtilsCreateStructuralPolygonsTraces(unittest.TestCase):
@@ -343,3 +241,80 @@ class TestPlotUtilsCreateBridgeOutlineTraces(unittest.TestCase):
         assert trace2.line.color == "red"
         assert trace2.line.width == 2
         assert list(trace2.x) == [3, 4]
+
+    def test_lines_with_same_style_share_one_trace(self) -> None:
+        """Test that line segments with the same color and width are merged into one trace, separated by NaN."""
+        # Arrange
+        bridge_lines_data: list[dict[str, Any]] = [
+            {"start": [0, 0], "end": [1, 0]},
+            {"start": [0, 1], "end": [1, 1], "color": "red", "width": 2},
+            {"start": [1, 0], "end": [1, 1]},
+        ]
+
+        # Act
+        traces = create_bridge_outline_traces(bridge_lines_data)
+
+        # Assert
+        assert len(traces) == 2
+        assert traces[0].line.color == "grey"
+        np.testing.assert_array_equal(traces[0].x, [0, 1, np.nan, 1, 1])
+        np.testing.assert_array_equal(traces[0].y, [0, 0, np.nan, 0, 1])
+        assert traces[1].line.color == "red"
+        assert list(traces[1].x) == [0, 1]
+
+    def test_style_arguments_and_dict_traces(self) -> None:
+        """Test the default line style, trace name and plain dict output used by the top view."""
+        # Arrange
+        bridge_lines_data: list[dict[str, Any]] = [{"start": [0, 0, 5], "end": [1, 0, 5]}, {"start": [1, 0], "end": [1, 1]}]
+
+        # Act
+        traces = create_bridge_outline_traces(bridge_lines_data, color="blue", width=2, name="Bridge Outline", as_dict=True)
+
+        # Assert
+        assert len(traces) == 1
+        trace = traces[0]
+        assert isinstance(trace, dict)
+        assert trace["type"] == "scatter"
+        assert trace["name"] == "Bridge Outline"
+        assert trace["line"] == {"color": "blue", "width": 2}
+        assert trace["x"].dtype == np.float32
+        np.testing.assert_array_equal(trace["x"], [0, 1, np.nan, 1, 1])
+
+    def test_dense_outline_uses_webgl(self) -> None:
+        """Test that an outline with more points than the WebGL threshold is drawn with scattergl."""
+        # Arrange
+        bridge_lines_data: list[dict[str, Any]] = [{"start": [i, 0], "end": [i + 1, 0]} for i in range(WEBGL_POINT_THRESHOLD // 3 + 1)]
+
+        # Act
+        traces = create_bridge_outline_traces(bridge_lines_data)
+
+        # Assert
+        assert len(traces) == 1
+        assert isinstance(traces[0], go.Scattergl)
+
+
+class TestPlotUtilsCreateSectionLineTrace(unittest.TestCase):
+    """Test cases for create_section_line_trace function."""
+
+    def test_small_section_uses_svg_scatter(self) -> None:
+        """Test that a section with few points is drawn as a regular scatter line trace."""
+        x = np.array([0.0, 1.0, np.nan, 2.0, 3.0])
+        y = np.array([0.0, 1.0, np.nan, 0.0, 1.0])
+
+        trace = create_section_line_trace(x, y)
+
+        assert trace["type"] == "scatter"
+        assert trace["mode"] == "lines"
+        # Coordinates are downcast to float32 for a smaller payload; the NaN line breaks are kept
+        assert trace["x"].dtype == np.float32
+        assert trace["y"].dtype == np.float32
+        np.testing.assert_array_equal(trace["x"], x.astype(np.float32))
+        np.testing.assert_array_equal(trace["y"], y.astype(np.float32))
+
+    def test_dense_section_uses_webgl(self) -> None:
+        """Test that a section with more points than the threshold is drawn with scattergl."""
+        x = np.zeros(WEBGL_POINT_THRESHOLD + 1)
+
+        trace = create_section_line_trace(x, x)
+
+        assert trace["type"] == "scattergl"
@@ -14,7 +14,7 @@ import plotly.graph_objects as go
 import trimesh
 from munch import Munch  # type: ignore[import-untyped]
 
-from src.geometry.cross_section import create_cross_section_annotations, create_cross_section_view
+from src.geometry.cross_section import calculate_max_array, create_cross_section_annotations, create_cross_section_view
 
 # Remove the specific module import if it's no longer needed for patch.object
 
@@ -70,8 +70,8 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         # Assert
         assert len(annotations) == 9  # 3 zone + 3 width + 3 height
         # Check one zone label for correct segment index (should be 0)
-        zone1_label = next(a for a in annotations if a.x == (segment1.bz2 / 2 + segment1.bz1 / 2) and "Z1" in a.text)
-        assert "Z1-0" in zone1_label.text
+        zone1_label = next(a for a in annotations if a["x"] == (segment1.bz2 / 2 + segment1.bz1 / 2) and "Z1" in a["text"])
+        assert "Z1-0" in zone1_label["text"]
 
     def test_segment_index_determination_multiple_segments(self) -> None:
         """Test segment index determination with multiple segments."""
@@ -94,11 +94,11 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         # Check zone label for segment index 1
         # segment2.bz2 / 2 + segment2.bz1 / 2
         expected_x_for_z1_s1 = segment2.bz2 / 2 + segment2.bz1 / 2
-        zone1_label_s1 = next(a for a in annotations if a.x == expected_x_for_z1_s1 and "Z1" in a.text)
-        assert "Z1-1" in zone1_label_s1.text
+        zone1_label_s1 = next(a for a in annotations if a["x"] == expected_x_for_z1_s1 and "Z1" in a["text"])
+        assert "Z1-1" in zone1_label_s1["text"]
         # Check width annotation for segment 1 data
-        width_z1_s1 = next(a for a in annotations if a.x == expected_x_for_z1_s1 and "b =" in a.text)
-        assert f"b = {segment2.bz1}m" in width_z1_s1.text
+        width_z1_s1 = next(a for a in annotations if a["x"] == expected_x_for_z1_s1 and "b =" in a["text"])
+        assert f"b = {segment2.bz1}m" in width_z1_s1["text"]
 
     def test_segment_index_at_boundary(self) -> None:
         """Test segment index determination when location is at segment boundary."""
@@ -116,8 +116,8 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         annotations = create_cross_section_annotations(params, all_z)
         # Assert: Function logic (<= cumulative_length) means it picks the first segment whose end includes the point.
         # So, for loc = 10.0, and l_values_cumulative = [10.0, 20.0], it picks segment_index = 0.
-        zone1_label = next(a for a in annotations if "Z1" in a.text)
-        assert "Z1-0" in zone1_label.text
+        zone1_label = next(a for a in annotations if "Z1" in a["text"])
+        assert "Z1-0" in zone1_label["text"]
 
     def test_segment_index_loc_beyond_last_segment(self) -> None:
         """Test segment index determination when location is beyond the last segment."""
@@ -133,8 +133,8 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         # Act
         annotations = create_cross_section_annotations(params, all_z)
         # Assert: Should still pick the last available segment_index (0 in this case)
-        zone1_label = next(a for a in annotations if "Z1" in a.text)
-        assert "Z1-0" in zone1_label.text
+        zone1_label = next(a for a in annotations if "Z1" in a["text"])
+        assert "Z1-0" in zone1_label["text"]
 
     def test_basic_annotation_properties_zone_labels(self) -> None:
         """Test basic annotation properties for zone labels in cross section."""
@@ -146,24 +146,24 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         annotations = create_cross_section_annotations(params, all_z)
         # Assert
         # Zone 1 Label (Z1-0)
-        ann_z1 = next(a for a in annotations if a.text == "<b>Z1-0</b>")
-        assert math.isclose(ann_z1.x, seg_data.bz2 / 2 + seg_data.bz1 / 2)  # (4/2 + 2/2) = 3
-        assert math.isclose(ann_z1.y, -seg_data.dz / 2)  # -0.5 / 2 = -0.25
-        assert ann_z1.font.size == 12
-        assert ann_z1.font.color == "black"
-        assert ann_z1.xanchor == "center"
-        assert ann_z1.yanchor == "middle"
-        assert not ann_z1.showarrow
+        ann_z1 = next(a for a in annotations if a["text"] == "<b>Z1-0</b>")
+        assert math.isclose(ann_z1["x"], seg_data.bz2 / 2 + seg_data.bz1 / 2)  # (4/2 + 2/2) = 3
+        assert math.isclose(ann_z1["y"], -seg_data.dz / 2)  # -0.5 / 2 = -0.25
+        assert ann_z1["font"]["size"] == 12
+        assert ann_z1["font"]["color"] == "black"
+        assert ann_z1["xanchor"] == "center"
+        assert ann_z1["yanchor"] == "middle"
+        assert not ann_z1["showarrow"]
 
         # Zone 2 Label (Z2-0)
-        ann_z2 = next(a for a in annotations if a.text == "<b>Z2-0</b>")
-        assert math.isclose(ann_z2.x, 0)
-        assert math.isclose(ann_z2.y, -seg_data.dz + seg_data.dz_2 / 2)  # -0.5 + 0.6/2 = -0.2
+        ann_z2 = next(a for a in annotations if a["text"] == "<b>Z2-0</b>")
+        assert math.isclose(ann_z2["x"], 0)
+        assert math.isclose(ann_z2["y"], -seg_data.dz + seg_data.dz_2 / 2)  # -0.5 + 0.6/2 = -0.2
 
         # Zone 3 Label (Z3-0)
-        ann_z3 = next(a for a in annotations if a.text == "<b>Z3-0</b>")
-        assert math.isclose(ann_z3.x, -seg_data.bz2 / 2 - seg_data.bz3 / 2)  # -(4/2) - (2/2) = -3
-        assert math.isclose(ann_z3.y, -seg_data.dz / 2)  # -0.25
+        ann_z3 = next(a for a in annotations if a["text"] == "<b>Z3-0</b>")
+        assert math.isclose(ann_z3["x"], -seg_data.bz2 / 2 - seg_data.bz3 / 2)  # -(4/2) - (2/2) = -3
+        assert math.isclose(ann_z3["y"], -seg_data.dz / 2)  # -0.25
 
     def test_basic_annotation_properties_width_labels(self) -> None:
         """Test basic annotation properties for width labels in cross section."""
@@ -176,20 +176,20 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         annotations = create_cross_section_annotations(params, all_z)
         # Assert
         # Width Zone 1 (bz1)
-        ann_w1 = next(a for a in annotations if a.text == f"<b>b = {seg_data.bz1}m</b>")
-        assert math.isclose(ann_w1.x, seg_data.bz2 / 2 + seg_data.bz1 / 2)
-        assert math.isclose(ann_w1.y, min_z_val - 1.0)
-        assert ann_w1.font.color == "green"
+        ann_w1 = next(a for a in annotations if a["text"] == f"<b>b = {seg_data.bz1}m</b>")
+        assert math.isclose(ann_w1["x"], seg_data.bz2 / 2 + seg_data.bz1 / 2)
+        assert math.isclose(ann_w1["y"], min_z_val - 1.0)
+        assert ann_w1["font"]["color"] == "green"
 
         # Width Zone 2 (bz2)
-        ann_w2 = next(a for a in annotations if a.text == f"<b>b = {seg_data.bz2}m</b>")
-        assert math.isclose(ann_w2.x, 0)
-        assert math.isclose(ann_w2.y, min_z_val - 1.0)
+        ann_w2 = next(a for a in annotations if a["text"] == f"<b>b = {seg_data.bz2}m</b>")
+        assert math.isclose(ann_w2["x"], 0)
+        assert math.isclose(ann_w2["y"], min_z_val - 1.0)
 
         # Width Zone 3 (bz3)
-        ann_w3 = next(a for a in annotations if a.text == f"<b>b = {seg_data.bz3}m</b>")
-        assert math.isclose(ann_w3.x, -seg_data.bz2 / 2 - seg_data.bz3 / 2)
-        assert math.isclose(ann_w3.y, min_z_val - 1.0)
+        ann_w3 = next(a for a in annotations if a["text"] == f"<b>b = {seg_data.bz3}m</b>")
+        assert math.isclose(ann_w3["x"], -seg_data.bz2 / 2 - seg_data.bz3 / 2)
+        assert math.isclose(ann_w3["y"], min_z_val - 1.0)
 
     def test_basic_annotation_properties_height_labels(self) -> None:
         """Test basic annotation properties for height labels in cross section."""
@@ -207,22 +207,22 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         expected_x_h3 = -seg_data.bz2 / 2 - seg_data.bz3
 
         # Height Zone 1 (dz)
-        ann_h1 = next(a for a in annotations if a.text == f"<b>h = {seg_data.dz}m</b>" and abs(a.x - expected_x_h1) < 1e-9)
-        assert math.isclose(ann_h1.x, expected_x_h1)
-        assert math.isclose(ann_h1.y, -seg_data.dz / 2)
-        assert ann_h1.font.color == "blue"
-        assert ann_h1.textangle == -90
-        assert ann_h1.xanchor == "right"
+        ann_h1 = next(a for a in annotations if a["text"] == f"<b>h = {seg_data.dz}m</b>" and abs(a["x"] - expected_x_h1) < 1e-9)
+        assert math.isclose(ann_h1["x"], expected_x_h1)
+        assert math.isclose(ann_h1["y"], -seg_data.dz / 2)
+        assert ann_h1["font"]["color"] == "blue"
+        assert ann_h1["textangle"] == -90
+        assert ann_h1["xanchor"] == "right"
 
         # Height Zone 2 (dz_2)
-        ann_h2 = next(a for a in annotations if a.text == f"<b>h = {seg_data.dz_2}m</b>" and abs(a.x - expected_x_h2) < 1e-9)
-        assert math.isclose(ann_h2.x, expected_x_h2)
-        assert math.isclose(ann_h2.y, -seg_data.dz + seg_data.dz_2 / 2)
+        ann_h2 = next(a for a in annotations if a["text"] == f"<b>h = {seg_data.dz_2}m</b>" and abs(a["x"] - expected_x_h2) < 1e-9)
+        assert math.isclose(ann_h2["x"], expected_x_h2)
+        assert math.isclose(ann_h2["y"], -seg_data.dz + seg_data.dz_2 / 2)
 
         # Height Zone 3 (dz)
-        ann_h3 = next(a for a in annotations if a.text == f"<b>h = {seg_data.dz}m</b>" and abs(a.x - expected_x_h3) < 1e-9)
-        assert math.isclose(ann_h3.x, expected_x_h3)
-        assert math.isclose(ann_h3.y, -seg_data.dz / 2)
+        ann_h3 = next(a for a in annotations if a["text"] == f"<b>h = {seg_data.dz}m</b>" and abs(a["x"] - expected_x_h3) < 1e-9)
+        assert math.isclose(ann_h3["x"], expected_x_h3)
+        assert math.isclose(ann_h3["y"], -seg_data.dz / 2)
 
     def test_input_params_as_dict(self) -> None:
         """Test that the function handles params as dict (gets converted to Munch internally)."""
@@ -233,9 +233,9 @@ class TestCreateCrossSectionAnnotations(unittest.TestCase):
         annotations = create_cross_section_annotations(params_dict, all_z)
         assert len(annotations) == 9
         # Check if one of the calculations is correct, implying Munch conversion worked.
-        ann_z1 = next(a for a in annotations if a.text == "<b>Z1-0</b>")
+        ann_z1 = next(a for a in annotations if a["text"] == "<b>Z1-0</b>")
         expected_x_z1 = segment1_dict["bz2"] / 2 + segment1_dict["bz1"] / 2
-        assert math.isclose(ann_z1.x, expected_x_z1)
+        assert math.isclose(ann_z1["x"], expected_x_z1)
 
 
 class TestCreateCrossSectionView(unittest.TestCase):
@@ -258,43 +258,20 @@ class TestCreateCrossSectionView(unittest.TestCase):
             ),
         )
 
-    @patch("src.geometry.cross_section.create_3d_model")
-    @patch("src.geometry.cross_section.create_cross_section")
+    @patch("src.geometry.section_view.create_section_path_cached")
     @patch("src.geometry.cross_section.create_cross_section_annotations")
-    @patch("src.geometry.cross_section.trimesh")
     def test_create_cross_section_view_basic_functionality(
         self,
-        mock_trimesh_module: MagicMock,
         mock_create_annotations: MagicMock,
-        mock_create_cross_section_func: MagicMock,
-        mock_create_3d_model: MagicMock,
+        mock_create_section_path_cached: MagicMock,
     ) -> None:
         """Test basic functionality of create_cross_section_view."""
         params = self._create_default_params(cross_section_loc=5.0)
         section_loc = 5.0
 
-        # Mock create_3d_model to return a scene with geometry
-        mock_3d_scene = MagicMock()
-        mock_3d_geometry = MagicMock()
-        mock_3d_geometry.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_3d_scene.geometry = mock_3d_geometry
-        mock_create_3d_model.return_value = mock_3d_scene
-
-        # Mock trimesh.util.concatenate for the first call (3D scene)
-        mock_combined_mesh = MagicMock(spec=trimesh.Trimesh)
-        mock_trimesh_module.util.concatenate.return_value = mock_combined_mesh
-
-        # Mock create_cross_section to return a 2D scene
-        mock_2d_scene = MagicMock()
-        mock_2d_geometry = MagicMock()
-        mock_2d_geometry.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_2d_scene.geometry = mock_2d_geometry
-        mock_create_cross_section_func.return_value = mock_2d_scene
-
-        # Mock the second trimesh.util.concatenate call (2D scene)
-        mock_2d_combined_mesh = MagicMock(spec=trimesh.Trimesh)
-        # Set up side_effect for multiple concatenate calls
-        mock_trimesh_module.util.concatenate.side_effect = [mock_combined_mesh, mock_2d_combined_mesh]
+        # Mock create_section_path_cached to return the section lines
+        mock_2d_combined_mesh = MagicMock(spec=trimesh.path.Path3D)
+        mock_create_section_path_cached.return_value = mock_2d_combined_mesh
 
         # Mock the 2D mesh properties
         mock_2d_combined_mesh.vertices = np.array([[0, 0, 0], [1, 0, 1], [0, 1, 1]])
@@ -310,15 +287,9 @@ class TestCreateCrossSectionView(unittest.TestCase):
         fig = create_cross_section_view(params, section_loc)
 
         # Verify function calls
-        mock_create_3d_model.assert_called_once_with(params, axes=False)
-        mock_trimesh_module.util.concatenate.assert_any_call(list(mock_3d_geometry.values()))
 
-        # Verify create_cross_section was called with correct parameters
-        mock_create_cross_section_func.assert_called_once_with(mock_combined_mesh, [section_loc, 0, 0], [1, 0, 0], axes=False)
-
-        # Verify second concatenate call
-        assert mock_trimesh_module.util.concatenate.call_count == 2
-        mock_trimesh_module.util.concatenate.assert_any_call(list(mock_2d_geometry.values()))
+        # Verify create_section_path_cached was called with correct parameters
+        mock_create_section_path_cached.assert_called_once_with(params, [section_loc, 0, 0], [1, 0, 0])
 
         # Verify annotations were created and added
         mock_create_annotations.assert_called_once()
@@ -331,39 +302,20 @@ class TestCreateCrossSectionView(unittest.TestCase):
         assert fig.layout.annotations == tuple(mock_annotations)
         assert fig.layout.title.text == "Dwarsdoorsnede (Cross Section)"
 
-    @patch("src.geometry.cross_section.create_3d_model")
-    @patch("src.geometry.cross_section.create_cross_section")
+    @patch("src.geometry.section_view.create_section_path_cached")
     @patch("src.geometry.cross_section.create_cross_section_annotations")
-    @patch("src.geometry.cross_section.trimesh")
     def test_create_cross_section_view_with_annotations(
         self,
-        mock_trimesh_module: MagicMock,
         mock_create_annotations: MagicMock,
-        mock_create_cross_section_func: MagicMock,
-        mock_create_3d_model: MagicMock,
+        mock_create_section_path_cached: MagicMock,
     ) -> None:
         """Test that annotations are correctly created and added to the figure."""
         params = self._create_default_params(cross_section_loc=10.0)
         section_loc = 10.0
 
-        # Mock create_3d_model
-        mock_3d_scene = MagicMock()
-        mock_3d_geometry = MagicMock()
-        mock_3d_geometry.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_3d_scene.geometry = mock_3d_geometry
-        mock_create_3d_model.return_value = mock_3d_scene
-
-        # Mock trimesh concatenate
-        mock_combined_mesh = MagicMock(spec=trimesh.Trimesh)
-        mock_2d_combined_mesh = MagicMock(spec=trimesh.Trimesh)
-        mock_trimesh_module.util.concatenate.side_effect = [mock_combined_mesh, mock_2d_combined_mesh]
-
-        # Mock create_cross_section
-        mock_2d_scene = MagicMock()
-        mock_2d_geometry = MagicMock()
-        mock_2d_geometry.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_2d_scene.geometry = mock_2d_geometry
-        mock_create_cross_section_func.return_value = mock_2d_scene
+        # Mock create_section_path_cached
+        mock_2d_combined_mesh = MagicMock(spec=trimesh.path.Path3D)
+        mock_create_section_path_cached.return_value = mock_2d_combined_mesh
 
         # Mock the 2D mesh with specific Z coordinates for annotation testing
         mock_2d_combined_mesh.vertices = np.array(
@@ -402,5 +354,18 @@ class TestCreateCrossSectionView(unittest.TestCase):
         assert len(fig.data) > 0  # Should have trace data
 
 
+class TestCalculateMaxArray(unittest.TestCase):
+    """Test cases for calculate_max_array."""
+
+    def test_three_zones_per_span(self) -> None:
+        """Test that each span between two sections allows three reinforcement zones."""
+        assert calculate_max_array(Munch({"bridge_segments_array": [{}, {}, {}]})) == 6
+
+    def test_no_spans_gives_no_zones(self) -> None:
+        """Test that the maximum is never negative when there is no span."""
+        assert calculate_max_array(Munch({"bridge_segments_array": [{}]})) == 0
+        assert calculate_max_array(Munch({"bridge_segments_array": []})) == 0
+
+
 if __name__ == "__main__":
     unittest.main()
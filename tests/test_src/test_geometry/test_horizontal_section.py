@@ -15,8 +15,7 @@ from munch import Munch  # type: ignore[import-untyped]
 
 from src.geometry.horizontal_section import create_horizontal_section_annotations, create_horizontal_section_view
 
-# model_creator functions (create_3d_model, create_cross_section) will be mocked from their original module
-# trimesh will be mocked where needed
+# model_creator functions (create_section_path_cached) will be mocked where needed
 
 
 class TestHorizontalSection(unittest.TestCase):
@@ -72,31 +71,31 @@ class TestHorizontalSection(unittest.TestCase):
             d_point_x_coords.append(current_sum)
 
         # Verify D1 label
-        d1_label = next(ann for ann in annotations if ann.text == "<b>D-1</b>")
-        assert math.isclose(d1_label.x, d_point_x_coords[0])
-        assert math.isclose(d1_label.y, max(all_y_mock) + 0.5)
+        d1_label = next(ann for ann in annotations if ann["text"] == "<b>D-1</b>")
+        assert math.isclose(d1_label["x"], d_point_x_coords[0])
+        assert math.isclose(d1_label["y"], max(all_y_mock) + 0.5)
 
         # Verify D2 label
-        d2_label = next(ann for ann in annotations if ann.text == "<b>D-2</b>")
-        assert math.isclose(d2_label.x, d_point_x_coords[1])
-        assert math.isclose(d2_label.y, max(all_y_mock) + 0.5)
+        d2_label = next(ann for ann in annotations if ann["text"] == "<b>D-2</b>")
+        assert math.isclose(d2_label["x"], d_point_x_coords[1])
+        assert math.isclose(d2_label["y"], max(all_y_mock) + 0.5)
 
         # Verify zone center calculations for segment parts
         l_values = [p.l for p in params.bridge_segments_array]
         zone_center_x_actual = [d_point_x_coords[0] + l_values[1] / 2]  # Center of segment between D1 and D2
 
         # Verify Z1-1 label (Zone 1 of first segment part)
-        z1_1_label = next(ann for ann in annotations if ann.text == "<b>Z1-1</b>")
-        assert math.isclose(z1_1_label.x, zone_center_x_actual[0])
-        assert math.isclose(z1_1_label.y, seg0.bz2 / 2 + seg0.bz1 / 2)
+        z1_1_label = next(ann for ann in annotations if ann["text"] == "<b>Z1-1</b>")
+        assert math.isclose(z1_1_label["x"], zone_center_x_actual[0])
+        assert math.isclose(z1_1_label["y"], seg0.bz2 / 2 + seg0.bz1 / 2)
 
         # Verify length dimension for segment part
-        len_label = next(ann for ann in annotations if f"l = {l_values[1]}m" in ann.text)
-        assert math.isclose(len_label.x, zone_center_x_actual[0])
+        len_label = next(ann for ann in annotations if f"l = {l_values[1]}m" in ann["text"])
+        assert math.isclose(len_label["x"], zone_center_x_actual[0])
 
         # Verify width annotation for bz1 at D1
-        width_bz1_d1 = next(ann for ann in annotations if f"b = {seg0.bz1}m" in ann.text and ann.y == (seg0.bz2 / 2 + seg0.bz1 / 2))
-        assert math.isclose(width_bz1_d1.x, d_point_x_coords[0] - 1)
+        width_bz1_d1 = next(ann for ann in annotations if f"b = {seg0.bz1}m" in ann["text"] and ann["y"] == (seg0.bz2 / 2 + seg0.bz1 / 2))
+        assert math.isclose(width_bz1_d1["x"], d_point_x_coords[0] - 1)
 
     def test_create_horizontal_section_annotations_only_zone2(self) -> None:
         """Test annotations when only_zone2 is True."""
@@ -115,31 +114,27 @@ class TestHorizontalSection(unittest.TestCase):
         assert len(annotations) == total_expected_annotations
 
         # Verify only zone2 annotations are present
-        assert not any("Z1-" in ann.text for ann in annotations)
-        assert not any("Z3-" in ann.text for ann in annotations)
-        assert not any("Z2-" in ann.text for ann in annotations)  # No Z2 labels due to single segment
+        assert not any("Z1-" in ann["text"] for ann in annotations)
+        assert not any("Z3-" in ann["text"] for ann in annotations)
+        assert not any("Z2-" in ann["text"] for ann in annotations)  # No Z2 labels due to single segment
 
         # Verify only bz2 width annotations are present
         seg0 = params.bridge_segments_array[0]
-        assert any(f"b = {seg0.bz2}m" in ann.text for ann in annotations)
-        assert not any(f"b = {seg0.bz1}m" in ann.text for ann in annotations)
-        assert not any(f"b = {seg0.bz3}m" in ann.text for ann in annotations)
+        assert any(f"b = {seg0.bz2}m" in ann["text"] for ann in annotations)
+        assert not any(f"b = {seg0.bz1}m" in ann["text"] for ann in annotations)
+        assert not any(f"b = {seg0.bz3}m" in ann["text"] for ann in annotations)
 
-    @patch("src.geometry.horizontal_section.create_3d_model")
-    @patch("src.geometry.horizontal_section.trimesh")  # Patch trimesh module used in horizontal_section
-    @patch("src.geometry.horizontal_section.create_cross_section")  # This is from model_creator
+    @patch("src.geometry.section_view.create_section_path_cached")
     @patch("src.geometry.horizontal_section.create_horizontal_section_annotations")
     def test_create_horizontal_section_view_basic_flow(
         self,
         mock_create_horizontal_annotations: MagicMock,
-        mock_model_creator_create_cross_section: MagicMock,
-        mock_trimesh_module: MagicMock,
-        mock_create_3d_model: MagicMock,
+        mock_create_section_path_cached: MagicMock,
     ) -> None:
         """Test basic flow of create_horizontal_section_view with mocks."""
         params = Munch(
             {
-                "bridge_segments_array": [  # Minimal data for create_3d_model mock
+                "bridge_segments_array": [  # Minimal data for the combined mesh mock
                     self._create_mock_segment_param(length=10)
                 ],
                 "input": Munch({"dimensions": Munch({"horizontal_section_loc": 0.5})}),  # For annotations call
@@ -147,30 +142,13 @@ class TestHorizontalSection(unittest.TestCase):
         )
         section_loc_z_val = 0.5
 
-        # Mock create_3d_model
-        mock_3d_scene = MagicMock()
-        mock_3d_geometry_collection = MagicMock()
-        mock_3d_geometry_collection.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_3d_scene.geometry = mock_3d_geometry_collection
-        mock_create_3d_model.return_value = mock_3d_scene
-
-        # Mock trimesh.util.concatenate (call 1 for 3D)
-        mock_combined_3d_mesh = MagicMock(spec=trimesh.Trimesh)
-
-        # Mock model_creator.create_cross_section
-        mock_2d_scene_from_cs = MagicMock(spec=trimesh.Scene)
-        mock_2d_geometry_collection_cs = MagicMock()
-        mock_2d_geometry_collection_cs.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_2d_scene_from_cs.geometry = mock_2d_geometry_collection_cs
-        mock_model_creator_create_cross_section.return_value = mock_2d_scene_from_cs
-
-        # Mock trimesh.util.concatenate (call 2 for 2D)
-        mock_combined_2d_mesh = MagicMock(spec=trimesh.Trimesh)
+        # Mock model_creator.create_section_path_cached (section lines)
+        mock_combined_2d_mesh = MagicMock(spec=trimesh.path.Path3D)
         mock_combined_2d_mesh.vertices = np.array([[0, 0, 0], [1, 1, 0], [1, 0, 0]])  # x, y, (z ignored for 2d plot)
         mock_entity1 = MagicMock()
         mock_entity1.points = [0, 1, 2]
         mock_combined_2d_mesh.entities = [mock_entity1]
-        mock_trimesh_module.util.concatenate.side_effect = [mock_combined_3d_mesh, mock_combined_2d_mesh]
+        mock_create_section_path_cached.return_value = mock_combined_2d_mesh
 
         # Mock create_horizontal_section_annotations
         mock_annotation_list = [go.layout.Annotation(text="Mock Annotation")]
@@ -180,16 +158,10 @@ class TestHorizontalSection(unittest.TestCase):
         fig = create_horizontal_section_view(params, section_loc_z_val)
 
         # Assertions
-        mock_create_3d_model.assert_called_once_with(params, axes=False)
-        assert mock_trimesh_module.util.concatenate.call_count == 2
-        mock_trimesh_module.util.concatenate.assert_any_call(mock_3d_geometry_collection.values())
 
         expected_plane_origin = [0, 0, section_loc_z_val]
         expected_plane_normal = [0, 0, 1]
-        mock_model_creator_create_cross_section.assert_called_once_with(
-            mock_combined_3d_mesh, expected_plane_origin, expected_plane_normal, axes=False
-        )
-        mock_trimesh_module.util.concatenate.assert_any_call(mock_2d_geometry_collection_cs.values())
+        mock_create_section_path_cached.assert_called_once_with(params, expected_plane_origin, expected_plane_normal)
 
         # Check traces from entities (plot uses x and y from vertices array)
         assert len(fig.data) == 1  # From mock_combined_2d_mesh.entities
@@ -200,7 +172,10 @@ class TestHorizontalSection(unittest.TestCase):
 
         # Check call to annotation function
         all_y_from_mock_mesh = [0, 1, 0]  # vertices[:, 1]
-        mock_create_horizontal_annotations.assert_called_once_with(params, all_y_from_mock_mesh)
+        mock_create_horizontal_annotations.assert_called_once()
+        args, _ = mock_create_horizontal_annotations.call_args
+        assert args[0] is params
+        np.testing.assert_array_equal(args[1], all_y_from_mock_mesh)
         assert fig.layout.annotations == tuple(mock_annotation_list)
 
         # Check layout
@@ -15,7 +15,7 @@ from munch import Munch  # type: ignore[import-untyped]
 
 from src.geometry.longitudinal_section import create_longitudinal_section
 
-# We'll need to mock functions from model_creator and trimesh
+# We'll need to mock functions from model_creator
 
 
 class TestLongitudinalSection(unittest.TestCase):
@@ -50,37 +50,14 @@ class TestLongitudinalSection(unittest.TestCase):
             }
         )
 
-    @patch("src.geometry.longitudinal_section.create_3d_model")
-    @patch("src.geometry.longitudinal_section.trimesh")  # Patch the whole trimesh module used in longitudinal_section
-    @patch("src.geometry.longitudinal_section.create_cross_section")
-    def test_create_longitudinal_section_basic_flow(
-        self, mock_create_cross_section: MagicMock, mock_trimesh_module: MagicMock, mock_create_3d_model: MagicMock
-    ) -> None:
+    @patch("src.geometry.section_view.create_section_path_cached")
+    def test_create_longitudinal_section_basic_flow(self, mock_create_section_path_cached: MagicMock) -> None:
         """Test the basic flow, mock calls, and some output aspects."""
         params = self._create_default_params(num_segments=2, section_loc_y=1.0)
         section_loc_y_val = 1.0
 
-        # --- Mock create_3d_model ---
-        mock_3d_scene = MagicMock()
-        mock_3d_geometry_collection = MagicMock()  # Simulate scene.geometry
-        mock_3d_geometry_collection.values.return_value = [MagicMock(spec=trimesh.Trimesh)]  # Simulate list of meshes
-        mock_3d_scene.geometry = mock_3d_geometry_collection
-        mock_create_3d_model.return_value = mock_3d_scene
-
-        # --- Mock trimesh.util.concatenate (first call for 3D) ---
-        mock_combined_3d_mesh = MagicMock(spec=trimesh.Trimesh)
-        # We need to configure the return value of mock_trimesh_module.util.concatenate
-        # It will be called twice. The first time for the 3D model, second for 2D.
-
-        # --- Mock create_cross_section ---
-        mock_2d_scene = MagicMock()  # This is what create_cross_section returns
-        mock_2d_geometry_collection = MagicMock()
-        mock_2d_geometry_collection.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_2d_scene.geometry = mock_2d_geometry_collection
-        mock_create_cross_section.return_value = mock_2d_scene
-
-        # --- Mock trimesh.util.concatenate (second call for 2D) ---
-        mock_combined_2d_mesh = MagicMock(spec=trimesh.Trimesh)
+        # --- Mock create_section_path_cached (section lines) ---
+        mock_combined_2d_mesh = MagicMock(spec=trimesh.path.Path3D)
         # Mock its vertices and entities as the function uses these directly
         mock_combined_2d_mesh.vertices = np.array(
             [
@@ -106,30 +83,27 @@ class TestLongitudinalSection(unittest.TestCase):
         mock_entity4.points = [6, 7]
         mock_combined_2d_mesh.entities = [mock_entity1, mock_entity2, mock_entity3, mock_entity4]
 
-        # Set up side_effect for concatenate to return different meshes on subsequent calls
-        mock_trimesh_module.util.concatenate.side_effect = [mock_combined_3d_mesh, mock_combined_2d_mesh]
+        mock_create_section_path_cached.return_value = mock_combined_2d_mesh
 
         # --- Act ---
         fig = create_longitudinal_section(params, section_loc_y_val)
 
         # --- Assertions ---
         # Check mock calls
-        mock_create_3d_model.assert_called_once_with(params, axes=False)
-        assert mock_trimesh_module.util.concatenate.call_count == 2
-        mock_trimesh_module.util.concatenate.assert_any_call(mock_3d_geometry_collection.values())
 
         expected_plane_origin = [0, section_loc_y_val, 0]
         expected_plane_normal = [0, 1, 0]
-        mock_create_cross_section.assert_called_once_with(mock_combined_3d_mesh, expected_plane_origin, expected_plane_normal, axes=False)
-        mock_trimesh_module.util.concatenate.assert_any_call(mock_2d_geometry_collection.values())
+        mock_create_section_path_cached.assert_called_once_with(params, expected_plane_origin, expected_plane_normal)
 
         # Check figure data (traces from entities)
         assert isinstance(fig, go.Figure)
-        assert len(fig.data) == len(mock_combined_2d_mesh.entities)  # One trace per entity
-        # Example check for the first trace (entity1)
+        assert len(fig.data) == 1  # All entities in a single trace
+        # The entities follow each other, separated by NaN
         trace0 = fig.data[0]
-        assert list(trace0.x) == [mock_combined_2d_mesh.vertices[0][0], mock_combined_2d_mesh.vertices[1][0]]  # x-coords of points 0,1
-        assert list(trace0.y) == [mock_combined_2d_mesh.vertices[0][2], mock_combined_2d_mesh.vertices[1][2]]  # z-coords of points 0,1 (y in plot)
+        expected_x = [0, 10, np.nan, 0, 10, np.nan, 10, 21, np.nan, 10, 21]
+        expected_z = [0, 0, np.nan, 0.5, 0.5, np.nan, 0, 0, np.nan, 0.6, 0.6]
+        np.testing.assert_allclose(trace0.x, expected_x, rtol=1e-6)
+        np.testing.assert_allclose(trace0.y, expected_z, rtol=1e-6)  # z-coords (float32) are the y in the plot
         assert trace0.line.color == "black"
 
         # Check annotations (complex part, needs more detailed setup for params and expected values)
@@ -144,12 +118,8 @@ class TestLongitudinalSection(unittest.TestCase):
         assert fig.layout.yaxis.scaleratio == 1
         assert not fig.layout.showlegend
 
-    @patch("src.geometry.longitudinal_section.create_3d_model")
-    @patch("src.geometry.longitudinal_section.trimesh")
-    @patch("src.geometry.longitudinal_section.create_cross_section")
-    def test_create_longitudinal_section_annotations_detailed(
-        self, mock_create_cross_section: MagicMock, mock_trimesh_module: MagicMock, mock_create_3d_model: MagicMock
-    ) -> None:
+    @patch("src.geometry.section_view.create_section_path_cached")
+    def test_create_longitudinal_section_annotations_detailed(self, mock_create_section_path_cached: MagicMock) -> None:
         """Test annotation creation in detail."""
         # --- Setup Params ---
         # Segment 1: l=10, bz2=4, dz=0.5, dz_2=0.8
@@ -166,16 +136,8 @@ class TestLongitudinalSection(unittest.TestCase):
         section_loc_y_val = 0.0  # For zone_nr calculation
 
         # --- Mocks (similar to basic_flow, but focus on 2D mesh output for annotations) ---
-        mock_create_3d_model.return_value = MagicMock()  # Simplified, as its output is just passed through
-        mock_combined_3d_mesh = MagicMock(spec=trimesh.Trimesh)
 
-        mock_2d_scene = MagicMock()
-        mock_2d_geometry_collection = MagicMock()
-        mock_2d_geometry_collection.values.return_value = [MagicMock(spec=trimesh.Trimesh)]
-        mock_2d_scene.geometry = mock_2d_geometry_collection
-        mock_create_cross_section.return_value = mock_2d_scene
-
-        mock_combined_2d_mesh = MagicMock(spec=trimesh.Trimesh)
+        mock_combined_2d_mesh = MagicMock(spec=trimesh.path.Path3D)
         # vertices: x, y(ignored), z(becomes y in plot)
         # For annotations, we mostly care about all_x and all_z ranges, and specific D-point x values
         # And the max z for D-label y-positioning.
@@ -201,7 +163,7 @@ class TestLongitudinalSection(unittest.TestCase):
         mock_entity_s2_top = MagicMock()
         mock_entity_s2_top.points = [6, 7]
         mock_combined_2d_mesh.entities = [mock_entity_s1_bottom, mock_entity_s1_top, mock_entity_s2_bottom, mock_entity_s2_top]
-        mock_trimesh_module.util.concatenate.side_effect = [mock_combined_3d_mesh, mock_combined_2d_mesh]
+        mock_create_section_path_cached.return_value = mock_combined_2d_mesh
 
         # --- Act ---
         fig = create_longitudinal_section(params, section_loc_y_val)
@@ -6,14 +6,17 @@ and related geometry operations using trimesh.
 """
 
 import math
+import threading
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 import trimesh  # For type hints and potentially direct use in complex mocks
 from munch import Munch  # type: ignore[import-untyped]
 
+from src.geometry import model_creator
 from src.geometry.model_creator import (
     BridgeSegmentDimensions,  # For test data construction
     LoadZoneGeometryData,  # For type hints in assertions
@@ -23,13 +26,36 @@ from src.geometry.model_creator import (
     create_black_dot,
     create_box,
     create_cross_section,
+    create_section_path,
+    create_section_path_cached,
+    export_3d_model_glb_cached,
+    get_section_line_coordinates,
+    get_segment_dimension_arrays,
     prepare_load_zone_geometry_data,  # Added for future tests
 )
 
 
+def _cached_model(params: Munch, axes: bool = True, section_planes: bool = False) -> trimesh.Scene:
+    """Looks up the cached 3D model for the parameters, the way the GLB export does."""
+    geometry_key = model_creator._geometry_cache_key(params, section_planes)  # noqa: SLF001
+    return model_creator._create_3d_model_from_key(geometry_key, axes, section_planes)  # noqa: SLF001
+
+
+def _cached_combined_mesh(params: Munch) -> trimesh.Trimesh:
+    """Looks up the cached section mesh for the parameters, the way the section slices do."""
+    return model_creator._combined_mesh(model_creator._geometry_cache_key(params))  # noqa: SLF001
+
+
 class TestModelCreator(unittest.TestCase):
     """Test cases for 3D model creation and geometry generation."""
 
+    def setUp(self) -> None:
+        """Start every test with empty model caches."""
+        model_creator._create_3d_model_from_key.cache_clear()  # noqa: SLF001
+        model_creator._create_combined_mesh_from_key.cache_clear()  # noqa: SLF001
+        model_creator._create_section_path_from_key.cache_clear()  # noqa: SLF001
+        model_creator._export_3d_model_glb_from_key.cache_clear()  # noqa: SLF001
+
     def test_create_box(self) -> None:
         """Test the create_box function with basic parameters."""
         vertices = np.array(
@@ -167,6 +193,46 @@ class TestModelCreator(unittest.TestCase):
         assert len(section_geom.vertices) >= 4
         assert section_geom.is_closed  # Cross-section of a box should be closed
 
+    def test_create_section_path(self) -> None:
+        """Test slicing a mesh into section lines, and the no-intersection case."""
+        box_to_slice = trimesh.creation.box(extents=(2, 2, 2))
+
+        section_path = create_section_path(box_to_slice, [0, 0, 0], [0, 0, 1])
+        assert isinstance(section_path, trimesh.path.Path3D)
+        assert len(section_path.entities) > 0
+        assert np.allclose(section_path.vertices[:, 2], 0.0)
+
+        # A plane outside the mesh has no section
+        assert create_section_path(box_to_slice, [0, 0, 5], [0, 0, 1]) is None
+
+    def test_get_section_line_coordinates(self) -> None:
+        """Test that the section entities are stacked into one array with NaN rows between them."""
+        section_path = trimesh.path.Path3D(
+            entities=[trimesh.path.entities.Line([0, 1, 2]), trimesh.path.entities.Line([3, 4])],
+            vertices=[[0, 0, 0], [1, 0, 0], [1, 1, 0], [5, 5, 1], [6, 5, 1]],
+        )
+
+        coords = get_section_line_coordinates(section_path)
+
+        expected = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [np.nan] * 3, [5, 5, 1], [6, 5, 1]]
+        np.testing.assert_array_equal(coords, expected)
+
+    def test_get_segment_dimension_arrays(self) -> None:
+        """Test collecting the segment dimensions into arrays, including the cumulative lengths."""
+        segments = [
+            self._create_mock_bridge_segment_param(length=0, bz1=1, bz2=2, bz3=1, dz=0.5, dz_2=0.8),
+            self._create_mock_bridge_segment_param(length=10, bz1=1.5, bz2=2.5, bz3=1.5, dz=0.6, dz_2=0.9),
+            self._create_mock_bridge_segment_param(length=5, bz1=2, bz2=3, bz3=2, dz=0.7, dz_2=1.0),
+        ]
+
+        dims = get_segment_dimension_arrays(segments)
+
+        np.testing.assert_array_equal(dims.length, [0, 10, 5])
+        np.testing.assert_array_equal(dims.length_cumulative, [0, 10, 15])
+        np.testing.assert_array_equal(dims.bz2, [2, 2.5, 3])
+        np.testing.assert_array_equal(dims.dz_2, [0.8, 0.9, 1.0])
+        assert dims.bz1.dtype == np.float64
+
     def test_prepare_load_zone_geometry_data(self) -> None:
         """Test the preparation of geometric data for load zone visualization."""
         # Test with two segments
@@ -356,6 +422,154 @@ class TestModelCreator(unittest.TestCase):
         # Verify that create_section_planes was called (section_planes=True and toggle_sections=True)
         mock_create_section_planes.assert_called_once_with(params)
 
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_cached_model_reuses_model_for_equal_params(self, mock_create_3d_model: MagicMock) -> None:
+        """Test that the cached model and its GLB export are built once per parameter set."""
+        box_with_normals = trimesh.creation.box()
+        _ = box_with_normals.vertex_normals  # Cached vertex normals would be exported by default
+        mock_create_3d_model.return_value = trimesh.Scene([box_with_normals, trimesh.creation.box()])
+
+        params = Munch({"bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)]})
+        equal_params = Munch({"bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)]})
+        changed_params = Munch({"bridge_segments_array": [self._create_mock_bridge_segment_param(l=12, bz1=1, bz2=2, bz3=1)]})
+
+        scene = _cached_model(params, axes=False)
+        assert _cached_model(equal_params, axes=False) is scene
+        mock_create_3d_model.assert_called_once_with(params, axes=False, section_planes=False)
+
+        # The GLB export of the cached model is cached as well
+        glb = export_3d_model_glb_cached(params, axes=False)
+        assert glb[:4] == b"glTF"
+        assert b"NORMAL" not in glb
+        assert export_3d_model_glb_cached(equal_params, axes=False) is glb
+        assert mock_create_3d_model.call_count == 1
+
+        _cached_model(changed_params, axes=False)
+        assert mock_create_3d_model.call_count == 2
+
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_cached_combined_mesh_ignores_non_geometry_params(self, mock_create_3d_model: MagicMock) -> None:
+        """Test that the combined mesh is only rebuilt when geometry-defining parameters change."""
+        mock_create_3d_model.side_effect = lambda *_args, **_kwargs: trimesh.Scene([trimesh.creation.box(), trimesh.creation.box()])
+
+        def make_params(length: float, section_loc: float) -> Munch:
+            return Munch.fromDict(
+                {
+                    "bridge_segments_array": [self._create_mock_bridge_segment_param(l=length, bz1=1, bz2=2, bz3=1)],
+                    "input": {"dimensions": {"cross_section_loc": section_loc}, "geometrie_wapening": {"dekking_onder": 55}},
+                }
+            )
+
+        mesh = _cached_combined_mesh(make_params(length=10, section_loc=1.0))
+        assert isinstance(mesh, trimesh.Trimesh)
+        # Both boxes are merged, with the faces of the second box indexing its own vertices
+        assert mesh.vertices.shape == (16, 3)
+        assert mesh.faces.shape == (24, 3)
+        assert mesh.faces[12:].min() == 8
+        # Moving the section location keeps the cached mesh
+        assert _cached_combined_mesh(make_params(length=10, section_loc=4.0)) is mesh
+        mock_create_3d_model.assert_called_once()
+        # The mesh is built from the geometry parameters only
+        built_params = mock_create_3d_model.call_args.args[0]
+        assert built_params.input.geometrie_wapening.dekking_onder == 55
+        assert "dimensions" not in built_params.input
+
+        # Changing the deck geometry rebuilds the mesh
+        assert _cached_combined_mesh(make_params(length=12, section_loc=4.0)) is not mesh
+        assert mock_create_3d_model.call_count == 2
+
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_combined_mesh_shares_running_build(self, mock_create_3d_model: MagicMock) -> None:
+        """Test that requests made while a mesh build is running wait for that build instead of starting another."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_create_3d_model(*_args: object, **_kwargs: object) -> trimesh.Scene:
+            started.set()
+            release.wait(timeout=10)
+            return trimesh.Scene([trimesh.creation.box(), trimesh.creation.box()])
+
+        mock_create_3d_model.side_effect = slow_create_3d_model
+        params = Munch({"bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)]})
+        meshes: list[trimesh.Trimesh] = []
+
+        first_request = threading.Thread(target=lambda: meshes.append(_cached_combined_mesh(params)))
+        first_request.start()
+        assert started.wait(timeout=10)
+        second_request = threading.Thread(target=lambda: meshes.append(_cached_combined_mesh(params)))
+        second_request.start()
+        release.set()
+        first_request.join(timeout=10)
+        second_request.join(timeout=10)
+
+        assert len(meshes) == 2
+        assert meshes[0] is meshes[1]
+        mock_create_3d_model.assert_called_once()
+        assert not model_creator._MESH_BUILDS_IN_FLIGHT  # noqa: SLF001
+
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_combined_mesh_build_error_is_not_kept(self, mock_create_3d_model: MagicMock) -> None:
+        """Test that a failed mesh build raises in the request and is retried by the next one."""
+        mock_create_3d_model.side_effect = [ValueError("invalid geometry"), trimesh.Scene([trimesh.creation.box()])]
+        params = Munch({"bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)]})
+
+        with pytest.raises(ValueError, match="invalid geometry"):
+            _cached_combined_mesh(params)
+        assert not model_creator._MESH_BUILDS_IN_FLIGHT  # noqa: SLF001
+        assert isinstance(_cached_combined_mesh(params), trimesh.Trimesh)
+
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_cached_model_section_planes_key(self, mock_create_3d_model: MagicMock) -> None:
+        """Test that section settings only invalidate the cached model when section planes are included."""
+        mock_create_3d_model.side_effect = lambda *_args, **_kwargs: trimesh.Scene([trimesh.creation.box(), trimesh.creation.box()])
+
+        def make_params(section_loc: float, zone_type: str = "Voetgangers") -> Munch:
+            return Munch.fromDict(
+                {
+                    "bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)],
+                    "load_zones_data_array": [{"zone_type": zone_type}],
+                    "input": {"dimensions": {"toggle_sections": True, "cross_section_loc": section_loc}},
+                }
+            )
+
+        scene = _cached_model(make_params(section_loc=1.0), section_planes=True)
+        # Load zones do not affect the model
+        assert _cached_model(make_params(section_loc=1.0, zone_type="Auto"), section_planes=True) is scene
+        # Moving a section plane does
+        assert _cached_model(make_params(section_loc=2.0), section_planes=True) is not scene
+        assert mock_create_3d_model.call_count == 2
+
+        # Without section planes the section location is ignored, and the section mesh reuses that model
+        _cached_model(make_params(section_loc=1.0), axes=False)
+        _cached_model(make_params(section_loc=3.0), axes=False)
+        _cached_combined_mesh(make_params(section_loc=4.0))
+        assert mock_create_3d_model.call_count == 3
+
+    @patch("src.geometry.model_creator.create_section_path", wraps=create_section_path)
+    @patch("src.geometry.model_creator.create_3d_model")
+    def test_create_section_path_cached_reuses_slices(self, mock_create_3d_model: MagicMock, mock_create_section_path: MagicMock) -> None:
+        """Test that a slice is only recomputed when the geometry or the plane changes."""
+        box = trimesh.creation.box(extents=(2, 2, 2))
+        mock_create_3d_model.return_value = trimesh.Scene([box])
+        params = Munch.fromDict(
+            {
+                "bridge_segments_array": [self._create_mock_bridge_segment_param(l=10, bz1=1, bz2=2, bz3=1)],
+                "load_zones_data_array": [{"zone_type": "Voetgangers"}],
+            }
+        )
+        params_other_load_zones = Munch.fromDict({**params, "load_zones_data_array": [{"zone_type": "Auto"}]})
+
+        section_path = create_section_path_cached(params, [0, 0, 0], [0, 0, 1])
+        assert isinstance(section_path, trimesh.path.Path3D)
+        assert create_section_path_cached(params_other_load_zones, [0, 0, 0], [0, 0, 1]) is section_path
+        assert create_section_path_cached(params, np.array([0.0, 0.0, 1e-9]), [0, 0, 1]) is section_path
+        assert create_section_path_cached(params, [0, 0, 0.5], [0, 0, 1]) is not section_path
+        assert mock_create_section_path.call_count == 2
+        mock_create_3d_model.assert_called_once()
+        # The sliced mesh is a copy, so slicing never touches the geometry of the cached scene
+        combined_mesh = _cached_combined_mesh(params)
+        assert combined_mesh is not box
+        np.testing.assert_array_equal(combined_mesh.vertices, box.vertices)
+
 
 if __name__ == "__main__":
     unittest.main()
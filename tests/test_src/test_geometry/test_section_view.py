@@ -0,0 +1,75 @@
+"""
+Test module for the shared section view rendering.
+
+This module contains tests for slicing the bridge model and drawing the section lines, ranges and annotations.
+"""
+
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import plotly.graph_objects as go
+import trimesh
+from munch import Munch  # type: ignore[import-untyped]
+
+from src.geometry.section_view import create_section_view
+
+
+class TestSectionView(unittest.TestCase):
+    """Test cases for create_section_view."""
+
+    @patch("src.geometry.section_view.create_section_path_cached")
+    def test_create_section_view(self, mock_create_section_path_cached: MagicMock) -> None:
+        """Test that the selected axes are drawn as one trace with padded ranges and the given layout."""
+        section_path = trimesh.load_path(np.array([[[0.0, -1.0, 0.0], [10.0, -1.0, 0.0]], [[0.0, 1.0, 0.0], [10.0, 1.0, 0.0]]]))
+        mock_create_section_path_cached.return_value = section_path
+        params = Munch({"bridge_segments_array": []})
+        layout: dict[str, Any] = {"title": {"text": "Test"}, "xaxis": {"title": {"text": "X"}}}
+        annotations_fn = MagicMock(return_value=[{"x": 0, "y": 0, "text": "label"}])
+
+        fig = create_section_view(params, [0, 0, 0], [0, 0, 1], (0, 1), layout, annotations_fn)
+
+        mock_create_section_path_cached.assert_called_once_with(params, [0, 0, 0], [0, 0, 1])
+        assert isinstance(fig, go.Figure)
+        assert len(fig.data) == 1
+        # Two line entities, separated by a NaN row
+        assert len(fig.data[0].x) == 5
+        assert np.isnan(fig.data[0].x[2])
+        assert fig.layout.title.text == "Test"
+        assert fig.layout.xaxis.title.text == "X"
+        # The shared section layout is merged in below the view's own layout
+        assert fig.layout.showlegend is False
+        assert fig.layout.xaxis.constrain == "domain"
+        assert fig.layout.yaxis.scaleanchor == "x"
+        assert list(fig.layout.xaxis.range) == [-2.0, 12.0]
+        assert list(fig.layout.yaxis.range) == [-3.0, 3.0]
+        assert fig.layout.annotations[0].text == "label"
+
+        # The annotations are built from the section points without the NaN separators
+        points = annotations_fn.call_args.args[0]
+        assert points.shape == (4, 3)
+        assert not np.isnan(points).any()
+        # The static layout template is not modified
+        assert "range" not in layout["xaxis"]
+        assert "yaxis" not in layout
+
+    @patch("src.geometry.section_view.create_section_path_cached")
+    def test_create_section_view_plane_outside_deck(self, mock_create_section_path_cached: MagicMock) -> None:
+        """Test that a plane missing the deck gives an empty view with a note instead of failing."""
+        mock_create_section_path_cached.return_value = None
+        annotations_fn = MagicMock()
+
+        fig = create_section_view(Munch({"bridge_segments_array": []}), [30, 0, 0], [1, 0, 0], (1, 2), {"title": {"text": "Test"}}, annotations_fn)
+
+        assert isinstance(fig, go.Figure)
+        assert len(fig.data) == 0
+        assert fig.layout.title.text == "Test"
+        assert fig.layout.yaxis.scaleanchor == "x"
+        assert len(fig.layout.annotations) == 1
+        assert "buiten het brugdek" in fig.layout.annotations[0].text
+        annotations_fn.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
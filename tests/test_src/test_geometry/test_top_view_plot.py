@@ -7,10 +7,11 @@ Plotly figures for top view visualization of bridge models.
 
 import unittest
 from typing import Any
-from unittest.mock import MagicMock, patch
 
+import numpy as np
 import plotly.graph_objects as go
 
+from src.common.plot_utils import WEBGL_POINT_THRESHOLD
 from src.geometry.top_view_plot import build_top_view_figure
 
 
@@ -111,50 +112,46 @@ class TestTopViewPlot(unittest.TestCase):
         fig = build_top_view_figure(geo_data)
 
         assert isinstance(fig, go.Figure)
-        # We expect 2 traces from bridge_lines based on the input
-        assert len(fig.data) == 2, "Incorrect number of data traces found for bridge lines."
-
-        # --- Check Trace 0 ---
-        trace_0_name = "Bridge Outline Segment 0"
-        bridge_line_trace_0 = None
-        for trace in fig.data:
-            if hasattr(trace, "name") and trace.name == trace_0_name:
-                bridge_line_trace_0 = trace
-                break
+        # All bridge lines are batched into one trace, with segments separated by None
+        assert len(fig.data) == 1, "Incorrect number of data traces found for bridge lines."
+
+        bridge_line_trace = fig.data[0]
+        assert bridge_line_trace.type == "scatter"
+        assert bridge_line_trace.name == "Bridge Outline"
+        assert bridge_line_trace.mode == "lines"
+        np.testing.assert_array_equal(bridge_line_trace.x, [0, 10, np.nan, 0, 10])
+        np.testing.assert_array_equal(bridge_line_trace.y, [0, 0, np.nan, 5, 5])
+        assert bridge_line_trace.line.color == "blue"  # SUT uses blue
+        assert bridge_line_trace.line.width == 2
+        assert bridge_line_trace.hoverinfo == "none"
+        assert not bridge_line_trace.showlegend
+
+    def test_build_top_view_figure_dense_outline_uses_webgl(self) -> None:
+        """Test that an outline with more points than the WebGL threshold is drawn with scattergl."""
+        geo_data = self._create_default_geometric_data()
+        # Each segment adds two points and a NaN break
+        geo_data["bridge_lines"] = [{"start": [i, 0], "end": [i + 1, 0]} for i in range(WEBGL_POINT_THRESHOLD // 3 + 1)]
+        fig = build_top_view_figure(geo_data)
 
-        assert bridge_line_trace_0 is not None, f"Trace '{trace_0_name}' not found."
-        assert bridge_line_trace_0 is not None  # for mypy
-
-        assert bridge_line_trace_0.mode == "lines"
-        expected_x_0 = [geo_data["bridge_lines"][0]["start"][0], geo_data["bridge_lines"][0]["end"][0]]
-        expected_y_0 = [geo_data["bridge_lines"][0]["start"][1], geo_data["bridge_lines"][0]["end"][1]]
-        assert list(bridge_line_trace_0.x) == expected_x_0
-        assert list(bridge_line_trace_0.y) == expected_y_0
-        assert bridge_line_trace_0.line.color == "blue"  # SUT uses blue
-        assert bridge_line_trace_0.line.width == 2
-        assert bridge_line_trace_0.hoverinfo == "none"
-        assert not bridge_line_trace_0.showlegend
-
-        # --- Check Trace 1 ---
-        trace_1_name = "Bridge Outline Segment 1"
-        bridge_line_trace_1 = None
-        for trace in fig.data:
-            if hasattr(trace, "name") and trace.name == trace_1_name:
-                bridge_line_trace_1 = trace
-                break
+        assert len(fig.data) == 1
+        assert fig.data[0].type == "scattergl"
+        assert fig.data[0].name == "Bridge Outline"
 
-        assert bridge_line_trace_1 is not None, f"Trace '{trace_1_name}' not found."
-        assert bridge_line_trace_1 is not None  # for mypy
+    def test_build_top_view_figure_batches_zone_polygons_by_color(self) -> None:
+        """Test that zone polygons with the same color are merged into one trace."""
+        geo_data = self._create_default_geometric_data()
+        geo_data["zone_polygons"] = [
+            {"vertices": [[0, 0], [1, 0], [1, 1]], "color": "red"},
+            {"vertices": [[0, 2], [1, 2], [1, 3]], "color": "blue"},
+            {"vertices": [[2, 0], [3, 0], [3, 1]], "color": "red"},
+        ]
+        fig = build_top_view_figure(geo_data)
 
-        assert bridge_line_trace_1.mode == "lines"
-        expected_x_1 = [geo_data["bridge_lines"][1]["start"][0], geo_data["bridge_lines"][1]["end"][0]]
-        expected_y_1 = [geo_data["bridge_lines"][1]["start"][1], geo_data["bridge_lines"][1]["end"][1]]
-        assert list(bridge_line_trace_1.x) == expected_x_1
-        assert list(bridge_line_trace_1.y) == expected_y_1
-        assert bridge_line_trace_1.line.color == "blue"
-        assert bridge_line_trace_1.line.width == 2
-        assert bridge_line_trace_1.hoverinfo == "none"
-        assert not bridge_line_trace_1.showlegend
+        assert len(fig.data) == 2
+        assert fig.data[0].fillcolor == "red"
+        np.testing.assert_array_equal(fig.data[0].x, [0, 1, 1, 0, np.nan, 2, 3, 3, 2])
+        assert fig.data[1].fillcolor == "blue"
+        assert list(fig.data[1].y) == [2, 2, 3, 2]
 
     def test_build_top_view_figure_with_zone_annotations(self) -> None:
         """Test figure creation with zone annotation data."""
@@ -222,31 +219,25 @@ class TestTopViewPlot(unittest.TestCase):
         assert ann_rot90.yanchor == "middle"
         assert ann_rot90.textangle == 90
 
-    @patch("src.geometry.top_view_plot.create_text_annotations_from_data")
-    def test_build_top_view_figure_with_cross_section_labels(self, mock_create_text_annotations: MagicMock) -> None:
+    def test_build_top_view_figure_with_cross_section_labels(self) -> None:
         """Test figure creation with cross section label data."""
         geo_data = self._create_default_geometric_data()
-        cs_label_data = [{"x": 1, "y": 1, "text": "CS1"}]
-        geo_data["cross_section_labels"] = cs_label_data
-
-        mock_cs_annotations = [go.layout.Annotation(text="Mocked CS Anno")]
-        mock_create_text_annotations.return_value = mock_cs_annotations
+        geo_data["cross_section_labels"] = [{"x": 1, "y": 1, "text": "CS1"}]
 
         fig = build_top_view_figure(geo_data)
 
-        mock_create_text_annotations.assert_called_once_with(
-            label_data=cs_label_data,
-            font_size=15,
-            font_color="black",
-            align="center",
-            xanchor="center",
-            yanchor="bottom",
-        )
-        assert len(fig.layout.annotations) == 2  # 1 mocked CS annotation + 1 north arrow
-        assert mock_cs_annotations[0] in fig.layout.annotations
-
-    @patch("src.geometry.top_view_plot.create_text_annotations_from_data")
-    def test_build_top_view_figure_with_all_data_types(self, mock_create_text_annotations: MagicMock) -> None:
+        assert len(fig.layout.annotations) == 2  # 1 CS annotation + 1 north arrow
+        cs_annotation = next(ann for ann in fig.layout.annotations if ann.text == "<b>CS1</b>")
+        assert cs_annotation.x == 1
+        assert cs_annotation.y == 1
+        assert cs_annotation.font.size == 15
+        assert cs_annotation.font.color == "black"
+        assert cs_annotation.align == "center"
+        assert cs_annotation.xanchor == "center"
+        assert cs_annotation.yanchor == "bottom"
+        assert not cs_annotation.showarrow
+
+    def test_build_top_view_figure_with_all_data_types(self) -> None:
         """Test with all data types present and a validation warning."""
         geo_data = {
             "zone_polygons": [{"vertices": [[0, 0], [1, 0], [0, 1]], "color": "red"}],
@@ -257,9 +248,6 @@ class TestTopViewPlot(unittest.TestCase):
         }
         warnings = ["Test Warning"]
 
-        mock_cs_anno_instance = go.layout.Annotation(text="Mocked CS Anno for All Data")
-        mock_create_text_annotations.return_value = [mock_cs_anno_instance]
-
         fig = build_top_view_figure(geo_data, validation_messages=warnings)
 
         assert isinstance(fig, go.Figure)
@@ -277,19 +265,10 @@ class TestTopViewPlot(unittest.TestCase):
         texts = [ann.text for ann in fig.layout.annotations]
         assert "<b>Z1</b>" in texts
         assert "<b>Dim1</b>" in texts
-        assert "Mocked CS Anno for All Data" in texts
+        assert "<b>CS-A</b>" in texts
         assert "<b>Waarschuwing (Belastingzones):</b> Test Warning" in texts
         assert "⥊" in texts  # North arrow
 
-        mock_create_text_annotations.assert_called_once_with(
-            label_data=geo_data["cross_section_labels"],
-            font_size=15,  # Match args in build_top_view_figure
-            font_color="black",
-            align="center",
-            xanchor="center",
-            yanchor="bottom",
-        )
-
     # Add more tests for zone polygons, bridge lines, zone annotations, dimension texts, cross section labels
 
 
@@ -0,0 +1,79 @@
+"""
+Test module for report generation.
+
+This module contains tests for creating the export report, with the Word template rendering and
+the PDF conversion mocked.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from munch import Munch  # type: ignore[import-untyped]
+
+from src.report import report_functions
+from src.report.report_functions import create_export_report
+
+
+@patch("src.report.report_functions.convert_word_to_pdf")
+@patch("src.report.report_functions.DocxTemplate")
+@patch("src.report.report_functions.OUTPUT_REPORT_PATH")
+class TestCreateExportReport(unittest.TestCase):
+    """Test cases for create_export_report and its cached PDF rendering."""
+
+    def setUp(self) -> None:
+        """Start every test with an empty report cache."""
+        report_functions._render_report_pdf.cache_clear()  # noqa: SLF001
+
+    @staticmethod
+    def _make_params(bridge_id: str) -> Munch:
+        """Helper to create the parameters the report reads."""
+        return Munch.fromDict({"info": {"bridge_objectnumm": bridge_id}})
+
+    def test_report_is_converted_once_per_context(
+        self, mock_template_path: MagicMock, mock_docx_template: MagicMock, mock_convert_word_to_pdf: MagicMock
+    ) -> None:
+        """Test that a report with an unchanged template and context reuses the converted PDF."""
+        mock_template_path.stat.return_value.st_mtime = 1.0
+        mock_convert_word_to_pdf.return_value.getvalue_binary.return_value = b"%PDF-report"
+
+        first_report = create_export_report(self._make_params("BRUG-1"))
+        second_report = create_export_report(self._make_params("BRUG-1"))
+
+        assert first_report.getvalue_binary() == b"%PDF-report"
+        assert second_report.getvalue_binary() == b"%PDF-report"
+        mock_docx_template.assert_called_once_with(mock_template_path)
+        mock_convert_word_to_pdf.assert_called_once()
+        # The template is rendered with the context, and the rendered document is converted
+        rendered_context = mock_docx_template.return_value.render.call_args.args[0]
+        assert rendered_context["BRIDGE_ID"] == "BRUG-1"
+        saved_document = mock_docx_template.return_value.save.call_args.args[0]
+        assert mock_convert_word_to_pdf.call_args.args[0] is saved_document
+
+    def test_report_is_converted_again_for_changed_bridge(
+        self, mock_template_path: MagicMock, mock_docx_template: MagicMock, mock_convert_word_to_pdf: MagicMock
+    ) -> None:
+        """Test that a different bridge ID converts the report again."""
+        mock_template_path.stat.return_value.st_mtime = 1.0
+
+        create_export_report(self._make_params("BRUG-1"))
+        create_export_report(self._make_params("BRUG-2"))
+
+        assert mock_convert_word_to_pdf.call_count == 2
+        assert mock_docx_template.return_value.render.call_args.args[0]["BRIDGE_ID"] == "BRUG-2"
+
+    def test_report_is_converted_again_for_changed_template(
+        self, mock_template_path: MagicMock, mock_docx_template: MagicMock, mock_convert_word_to_pdf: MagicMock
+    ) -> None:
+        """Test that editing the template (a new modification time) converts the report again."""
+        mock_template_path.stat.return_value.st_mtime = 1.0
+        create_export_report(self._make_params("BRUG-1"))
+
+        mock_template_path.stat.return_value.st_mtime = 2.0
+        create_export_report(self._make_params("BRUG-1"))
+
+        assert mock_docx_template.call_count == 2
+        assert mock_convert_word_to_pdf.call_count == 2
+
+
+if __name__ == "__main__":
+    unittest.main()